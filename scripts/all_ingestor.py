@@ -21,18 +21,38 @@
 import pandas as pd
 from ingest_data import *
 from datetime import datetime
+import atexit
 import logging
+import logging.handlers
 from pathlib import Path
-import configparser
 import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Closes the handlers of logger, a MemoryHandler flushes its buffer and its target FileHandler
+# is closed too (MemoryHandler.close drops the target without closing it)
+def close_handlers(logger):
+    for handler in list(logger.handlers):
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+    logger.handlers.clear()
+
+# Table loggers with buffered file handlers, flushed and closed by a single exit hook
+_buffered_loggers = set()
+
+@atexit.register
+def close_buffered_loggers():
+    for table_logger in _buffered_loggers:
+        close_handlers(table_logger)
+
 # Function to configure logger for specific table
 def configure_logger(table_name, base_dir):
     logger = logging.getLogger(table_name)  # Unique logger per table
-    logger.handlers.clear()  # Clear existing handlers to avoid duplicates
+    # Flush buffered records and close the log file before clearing existing handlers to avoid duplicates
+    close_handlers(logger)
     logger.setLevel(logging.INFO)
 
     log_dir = Path(base_dir) / 'logs'
@@ -48,20 +68,29 @@ def configure_logger(table_name, base_dir):
     stream_handler.setLevel(logging.INFO)
     stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 
-    logger.addHandler(file_handler)
+    # Buffer file writes: records are written every 1024 records, on ERROR and at exit
+    memory_handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+    memory_handler.setLevel(logging.INFO)
+    _buffered_loggers.add(logger)
+
+    logger.addHandler(memory_handler)
     logger.addHandler(stream_handler)
     return logger
 
+# Returns the gzip compressed export (path + '.gz') when it exists, pandas decompresses it on read
+def resolve_data_file(path):
+    gz_path = Path(f'{path}.gz')
+    return gz_path if gz_path.exists() else Path(path)
+
 if __name__ == '__main__':
     c_month = '7'  # current ingestion month
     config_file_path = 'config.ini'
     ingestion_date_str = '2025-08-26' # date of the ingestion/execution
     ingestion_date = datetime.strptime(ingestion_date_str, '%Y-%m-%d').date()
 
-    # Load configuration to get BASE_DIR
-    config = configparser.ConfigParser()
-    if not config.read(config_file_path):
-        raise FileNotFoundError(f"Config file not found at {config_file_path}")
+    # Load configuration to get BASE_DIR, the cached parser from ingest_data is reused by the
+    # ingest calls below
+    config = load_config(config_file_path)
     BASE_DIR = Path(config['PATHS']['BASE_DIR'])
 
     # Configure loggers
@@ -71,15 +100,23 @@ if __name__ == '__main__':
 
     clients_logger.info(f"Starting ingestion process for month {c_month}")
 
-    # Read estimates data
-    estimates = pd.read_csv(f'../data/estimates/2025/2025-{c_month}.csv')
-    clients_logger.info(f"Read {len(estimates)} estimates from ../data/estimates/2025/2025-{c_month}.csv")
+    # Read estimates data. The CSV files stay on the C parser: quoted values can span lines,
+    # which the pyarrow engine does not split safely across blocks, and its type inference
+    # differs on these raw exports
+    estimates_file = resolve_data_file(f'../data/estimates/2025/2025-{c_month}.csv')
+    estimates = pd.read_csv(estimates_file)
+    clients_logger.info(f"Read {len(estimates)} estimates from {estimates_file}")
 
     # Read clients data and remove duplicates
-    clients = pd.read_csv(f'../data/clients/2025/Clients.csv')
-    clients_logger.info(f"Read {len(clients)} clients from ../data/clients/2025/Clients.csv")
-    clients = clients.sort_values('**(Do not change this) Joist Client ID', ascending=False).drop_duplicates(
-        subset=['Name'], keep='first')
+    clients_file = resolve_data_file('../data/clients/2025/Clients.csv')
+    clients = pd.read_csv(clients_file)
+    clients_logger.info(f"Read {len(clients)} clients from {clients_file}")
+    # Keep the row with the highest Joist Client ID per Name, only the ID column is ranked.
+    # Missing IDs rank last, so a Name without any ID still keeps its first row, and the kept
+    # rows are returned in ID order like the former sort_values + drop_duplicates
+    order = clients['**(Do not change this) Joist Client ID'].rank(method='first', ascending=False, na_option='bottom')
+    latest = order.groupby(clients['Name'], sort=False, dropna=False).idxmin()
+    clients = clients.loc[order.loc[latest].sort_values().index]
     clients_logger.info(f"After deduplication, {len(clients)} unique clients remain")
 
     # Ingest clients with timing - before ingesting estimates ( foreign key constraint )
@@ -96,8 +133,9 @@ if __name__ == '__main__':
 
 
     # Read invoices data
-    invoices = pd.read_csv(f'../data/invoices/2025/2025-{c_month}.csv', sep='\t')
-    clients_logger.info(f"Read {len(invoices)} invoices from ../data/invoices/2025/2025-{c_month}.csv")
+    invoices_file = resolve_data_file(f'../data/invoices/2025/2025-{c_month}.csv')
+    invoices = pd.read_csv(invoices_file, sep='\t')
+    clients_logger.info(f"Read {len(invoices)} invoices from {invoices_file}")
 
     # Ingest invoices with timing
     start_time = time.time()
@@ -1,8 +1,12 @@
 import configparser
+import csv
+import io
+import atexit
 import logging
+import logging.handlers
+from functools import lru_cache
 from pathlib import Path
-import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 
 # Set BASE_DIR to the directory of the current script
 BASE_DIR = Path(__file__).parent.parent
@@ -12,9 +16,30 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def close_handlers(logger):
+    """
+    Closes the handlers of a logger. A MemoryHandler flushes its buffer, and its target
+    FileHandler is closed too, since MemoryHandler.close drops the target without closing it.
+
+    Args:
+        logger (logging.Logger): Logger whose handlers are closed and removed.
+    """
+    for handler in list(logger.handlers):
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+    logger.handlers.clear()
+
+
+# Buffered records are written once at exit, whichever handlers configure_logger installed last
+atexit.register(close_handlers, logger)
+
+
 def configure_logger(base_dir):
     """Configure logger with file and stream handlers."""
-    logger.handlers.clear()  # Clear existing handlers to avoid duplicates
+    # Flush buffered records and close the log file before clearing existing handlers to avoid duplicates
+    close_handlers(logger)
     logger.setLevel(logging.INFO)
 
     log_dir = Path(base_dir) / 'logs'
@@ -29,11 +54,88 @@ def configure_logger(base_dir):
     stream_handler.setLevel(logging.INFO)
     stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 
-    logger.addHandler(file_handler)
+    # Buffer file writes: records are written every 1024 records, on ERROR and at exit
+    memory_handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+    memory_handler.setLevel(logging.INFO)
+
+    logger.addHandler(memory_handler)
     logger.addHandler(stream_handler)
     return logger
 
 
+@lru_cache(maxsize=None)
+def load_config(config_path):
+    """
+    Reads the config.ini file once, later calls with the same path return the cached parser.
+
+    Args:
+        config_path (str): Path to the config.ini file.
+
+    Returns:
+        configparser.ConfigParser: Parsed configuration.
+    """
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    return config
+
+
+@lru_cache(maxsize=None)
+def get_engine(config_path):
+    """
+    Creates the SQLAlchemy engine once per config file, its connection pool is shared by all exports.
+
+    Args:
+        config_path (str): Path to the config.ini file.
+
+    Returns:
+        Engine: SQLAlchemy engine for database connection.
+    """
+    config = load_config(config_path)
+    DB_USER = config['DATABASE']['DB_USER']
+    DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
+    DB_HOST = config['DATABASE']['DB_HOST']
+    DB_PORT = config['DATABASE']['DB_PORT']
+    DB_NAME = config['DATABASE']['DB_NAME']
+    DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
+    return create_engine(DB_URL, pool_pre_ping=True, pool_size=8)
+
+
+def copy_query_to_csv(engine, query_sql, csv_file):
+    """
+    Streams the result of a SELECT statement into a CSV file with COPY ... TO STDOUT,
+    the rows are written by the server and never materialized in pandas.
+    When the driver has no COPY support the fetched rows are written with the csv module.
+
+    Args:
+        engine: SQLAlchemy engine for database connection.
+        query_sql (str): SELECT statement to export.
+        csv_file (Path): Path of the CSV file to write.
+
+    Returns:
+        int: Number of rows written.
+    """
+    query_sql = query_sql.strip().rstrip(';')
+    raw_connection = engine.raw_connection()
+    try:
+        cur = raw_connection.cursor()
+        try:
+            with open(csv_file, 'w', newline='') as f:
+                if hasattr(cur, 'copy_expert'):
+                    cur.copy_expert(f"COPY ({query_sql}) TO STDOUT WITH CSV HEADER", f)
+                    return cur.rowcount
+
+                cur.execute(query_sql)
+                rows = cur.fetchall()
+                writer = csv.writer(f)
+                writer.writerow([col[0] for col in cur.description])
+                writer.writerows(rows)
+                return len(rows)
+        finally:
+            cur.close()
+    finally:
+        raw_connection.close()
+
+
 def export_customers(config_path, engine):
     """
     Exports full_name and email_address of clients who have invoices and valid email addresses to customers.csv.
@@ -43,47 +145,40 @@ def export_customers(config_path, engine):
         engine: SQLAlchemy engine for database connection.
 
     Returns:
-        pd.DataFrame: DataFrame with query results.
+        int: Number of rows exported.
     """
     try:
         # Read configuration
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        DB_NAME = config['DATABASE']['DB_NAME']
-
-        # Configure logger
-        configure_logger(BASE_DIR)
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
 
         logger.info(f"Using database: {DB_NAME} for export_customers")
 
-        # SQL query to select clients with invoices and valid email_address
-        query = text("""
-        SELECT DISTINCT c.full_name, c.email_address
-        FROM clients c
-        JOIN invoices i ON c.full_name = i.full_name
-        WHERE c.email_address IS NOT NULL
-        AND NOT (
-            c.email_address LIKE '%@%@%'  -- Multiple @ symbols
-            OR c.email_address LIKE '%,%'  -- Contains commas
-            OR c.email_address LIKE '% %'  -- Contains spaces
-            OR c.email_address ~ '[^a-zA-Z0-9.@_-]'  -- Contains invalid characters
-        )
-        ORDER BY c.full_name;
-        """)
-
-        # Execute query and load into DataFrame
-        with engine.connect() as connection:
-            df = pd.read_sql(query, connection)
-            logger.info(f"Retrieved {len(df)} rows for customers with invoices and valid emails")
-
-        # Save DataFrame to CSV
+        # SQL query to select clients with invoices and valid email_address,
+        # one row per email_address keeping the first full_name
+        query = """
+        SELECT full_name, email_address
+        FROM (
+            SELECT DISTINCT ON (c.email_address) c.full_name, c.email_address
+            FROM clients c
+            JOIN invoices i ON c.full_name = i.full_name
+            WHERE c.email_address IS NOT NULL
+            -- Same predicate as the clients_valid_email_idx partial index
+            AND c.email_address NOT LIKE '%@%@%'  -- Multiple @ symbols
+            AND c.email_address NOT LIKE '%,%'  -- Contains commas
+            AND c.email_address NOT LIKE '% %'  -- Contains spaces
+            AND c.email_address !~ '[^a-zA-Z0-9.@_-]'  -- Contains invalid characters
+            ORDER BY c.email_address, c.full_name
+        ) customers
+        ORDER BY full_name
+        """
+
+        # Stream query results straight to CSV
         csv_file = BASE_DIR / 'data/clients/customers.csv'
         csv_file.parent.mkdir(exist_ok=True)
-        df = df.drop_duplicates(subset='email_address', keep='first')
-        df.to_csv(csv_file, index=False)
-        logger.info(f"Saved customers data to {csv_file}")
+        rows = copy_query_to_csv(engine, query, csv_file)
+        logger.info(f"Saved {rows} rows for customers with invoices and valid emails to {csv_file}")
 
-        return df
+        return rows
 
     except Exception as e:
         logger.error(f"Error in export_customers: {str(e)}")
@@ -98,49 +193,42 @@ def export_leads(config_path, engine):
         engine: SQLAlchemy engine for database connection.
 
     Returns:
-        pd.DataFrame: DataFrame with query results.
+        int: Number of rows exported.
     """
     try:
         # Read configuration
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        DB_NAME = config['DATABASE']['DB_NAME']
-
-        # Configure logger
-        configure_logger(BASE_DIR)
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
 
         logger.info(f"Using database: {DB_NAME} for export_leads")
 
-        # SQL query to select clients with estimates but no invoices and valid email_address
-        query = text("""
-        SELECT DISTINCT c.full_name, c.email_address
-        FROM clients c
-        JOIN estimates e ON c.full_name = e.full_name
-        LEFT JOIN invoices i ON c.full_name = i.full_name
-        WHERE i.full_name IS NULL 
-        AND c.email_address IS NOT NULL
-        AND NOT (
-            c.email_address LIKE '%@%@%'  -- Multiple @ symbols
-            OR c.email_address LIKE '%,%'  -- Contains commas
-            OR c.email_address LIKE '% %'  -- Contains spaces
-            OR c.email_address ~ '[^a-zA-Z0-9.@_-]'  -- Contains invalid characters
-        )
-        ORDER BY c.full_name;
-        """)
-
-        # Execute query and load into DataFrame
-        with engine.connect() as connection:
-            df = pd.read_sql(query, connection)
-            logger.info(f"Retrieved {len(df)} rows for leads with estimates but no invoices and valid emails")
-
-        # Save DataFrame to CSV
+        # SQL query to select clients with estimates but no invoices and valid email_address,
+        # one row per email_address keeping the first full_name
+        query = """
+        SELECT full_name, email_address
+        FROM (
+            SELECT DISTINCT ON (c.email_address) c.full_name, c.email_address
+            FROM clients c
+            JOIN estimates e ON c.full_name = e.full_name
+            LEFT JOIN invoices i ON c.full_name = i.full_name
+            WHERE i.full_name IS NULL
+            AND c.email_address IS NOT NULL
+            -- Same predicate as the clients_valid_email_idx partial index
+            AND c.email_address NOT LIKE '%@%@%'  -- Multiple @ symbols
+            AND c.email_address NOT LIKE '%,%'  -- Contains commas
+            AND c.email_address NOT LIKE '% %'  -- Contains spaces
+            AND c.email_address !~ '[^a-zA-Z0-9.@_-]'  -- Contains invalid characters
+            ORDER BY c.email_address, c.full_name
+        ) leads
+        ORDER BY full_name
+        """
+
+        # Stream query results straight to CSV
         csv_file = BASE_DIR / 'data/clients/leads.csv'
         csv_file.parent.mkdir(exist_ok=True)
-        df = df.drop_duplicates(subset='email_address', keep='first')
-        df.to_csv(csv_file, index=False)
-        logger.info(f"Saved leads data to {csv_file}")
+        rows = copy_query_to_csv(engine, query, csv_file)
+        logger.info(f"Saved {rows} rows for leads with estimates but no invoices and valid emails to {csv_file}")
 
-        return df
+        return rows
 
     except Exception as e:
         logger.error(f"Error in export_leads: {str(e)}")
@@ -155,52 +243,142 @@ def export_all_clients(config_path, engine):
         engine: SQLAlchemy engine for database connection.
 
     Returns:
-        pd.DataFrame: DataFrame with query results.
+        int: Number of rows exported.
     """
     try:
         # Read configuration
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        DB_NAME = config['DATABASE']['DB_NAME']
-
-        # Configure logger
-        configure_logger(BASE_DIR)
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
 
         logger.info(f"Using database: {DB_NAME} for export_all_clients")
 
-        # SQL query to select all unique clients with valid email_address
-        query = text("""
-        SELECT DISTINCT full_name, email_address
-        FROM clients
-        WHERE email_address IS NOT NULL
-        AND NOT (
-            email_address LIKE '%@%@%'  -- Multiple @ symbols
-            OR email_address LIKE '%,%'  -- Contains commas
-            OR email_address LIKE '% %'  -- Contains spaces
-            OR email_address ~ '[^a-zA-Z0-9.@_-]'  -- Contains invalid characters
-        )
-        ORDER BY full_name;
-        """)
-
-        # Execute query and load into DataFrame
-        with engine.connect() as connection:
-            df = pd.read_sql(query, connection)
-            logger.info(f"Retrieved {len(df)} rows for all unique clients with valid emails")
-
-        # Save DataFrame to CSV
+        # SQL query to select all unique clients with valid email_address,
+        # one row per email_address keeping the first full_name
+        query = """
+        SELECT full_name, email_address
+        FROM (
+            SELECT DISTINCT ON (email_address) full_name, email_address
+            FROM clients
+            WHERE email_address IS NOT NULL
+            -- Same predicate as the clients_valid_email_idx partial index
+            AND email_address NOT LIKE '%@%@%'  -- Multiple @ symbols
+            AND email_address NOT LIKE '%,%'  -- Contains commas
+            AND email_address NOT LIKE '% %'  -- Contains spaces
+            AND email_address !~ '[^a-zA-Z0-9.@_-]'  -- Contains invalid characters
+            ORDER BY email_address, full_name
+        ) all_clients
+        ORDER BY full_name
+        """
+
+        # Stream query results straight to CSV
         csv_file = BASE_DIR / 'data/clients/all_clients.csv'
         csv_file.parent.mkdir(exist_ok=True)
-        df = df.drop_duplicates(subset='email_address', keep='first')
-        df.to_csv(csv_file, index=False)
-        logger.info(f"Saved all clients data to {csv_file}")
+        rows = copy_query_to_csv(engine, query, csv_file)
+        logger.info(f"Saved {rows} rows for all unique clients with valid emails to {csv_file}")
 
-        return df
+        return rows
 
     except Exception as e:
         logger.error(f"Error in export_all_clients: {str(e)}")
         raise
 
 
+def export_email_lists(config_path, engine):
+    """
+    Exports customers.csv, leads.csv and all_clients.csv from a single query, so clients, invoices
+    and estimates are scanned once instead of once per export. Each file gets the same rows as
+    export_customers, export_leads and export_all_clients: one row per email_address, keeping the first full_name.
+
+    Args:
+        config_path (str): Path to the config.ini file.
+        engine: SQLAlchemy engine for database connection.
+
+    Returns:
+        dict: Number of rows exported per file name.
+    """
+    try:
+        # Read configuration
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
+
+        logger.info(f"Using database: {DB_NAME} for export_email_lists")
+
+        # SQL query to select all clients with valid email_address flagged as customer (has invoices)
+        # or lead (has estimates but no invoices). For each list the first full_name per email_address
+        # is picked like the DISTINCT ON of the single exports, and the rows are returned ordered by
+        # full_name with the database collation
+        query = """
+        WITH valid AS (
+            SELECT full_name, email_address
+            FROM clients
+            WHERE email_address IS NOT NULL
+            -- Same predicate as the clients_valid_email_idx partial index
+            AND email_address NOT LIKE '%@%@%'  -- Multiple @ symbols
+            AND email_address NOT LIKE '%,%'  -- Contains commas
+            AND email_address NOT LIKE '% %'  -- Contains spaces
+            AND email_address !~ '[^a-zA-Z0-9.@_-]'  -- Contains invalid characters
+        ),
+        has_inv AS (SELECT DISTINCT full_name FROM invoices),
+        has_est AS (SELECT DISTINCT full_name FROM estimates),
+        flagged AS (
+            SELECT DISTINCT
+                v.full_name,
+                v.email_address,
+                i.full_name IS NOT NULL AS is_customer,
+                i.full_name IS NULL AND e.full_name IS NOT NULL AS is_lead
+            FROM valid v
+            LEFT JOIN has_inv i ON i.full_name = v.full_name
+            LEFT JOIN has_est e ON e.full_name = v.full_name
+        ),
+        ranked AS (
+            SELECT
+                full_name,
+                email_address,
+                ROW_NUMBER() OVER (PARTITION BY email_address ORDER BY full_name) = 1 AS in_all_clients,
+                is_customer AND ROW_NUMBER() OVER (PARTITION BY email_address, is_customer ORDER BY full_name) = 1 AS in_customers,
+                is_lead AND ROW_NUMBER() OVER (PARTITION BY email_address, is_lead ORDER BY full_name) = 1 AS in_leads
+            FROM flagged
+        )
+        SELECT full_name, email_address, in_all_clients, in_customers, in_leads
+        FROM ranked
+        WHERE in_all_clients OR in_customers OR in_leads
+        ORDER BY full_name
+        """
+
+        # Fetch the rows once through COPY into an in-memory buffer
+        buf = io.StringIO()
+        raw_connection = engine.raw_connection()
+        try:
+            with raw_connection.cursor() as cur:
+                cur.copy_expert(f"COPY ({query.strip()}) TO STDOUT WITH CSV", buf)
+        finally:
+            raw_connection.close()
+        buf.seek(0)
+
+        # Dispatch the rows to each list in a single pass, they already come in full_name order
+        lists = {'customers': [], 'leads': [], 'all_clients': []}
+        for full_name, email_address, in_all_clients, in_customers, in_leads in csv.reader(buf):
+            for name, selected in (('all_clients', in_all_clients), ('customers', in_customers), ('leads', in_leads)):
+                if selected == 't':
+                    lists[name].append((full_name, email_address))
+
+        # Save each list to CSV
+        counts = {}
+        for name, rows in lists.items():
+            csv_file = BASE_DIR / f'data/clients/{name}.csv'
+            csv_file.parent.mkdir(exist_ok=True)
+            with open(csv_file, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['full_name', 'email_address'])
+                writer.writerows(rows)
+            counts[name] = len(rows)
+            logger.info(f"Saved {len(rows)} rows for {name} to {csv_file}")
+
+        return counts
+
+    except Exception as e:
+        logger.error(f"Error in export_email_lists: {str(e)}")
+        raise
+
+
 def export_clients_without_email(config_path, engine):
     """
     Exports all columns of clients with NULL email_address to clients_without_email.csv.
@@ -210,39 +388,29 @@ def export_clients_without_email(config_path, engine):
         engine: SQLAlchemy engine for database connection.
 
     Returns:
-        pd.DataFrame: DataFrame with query results.
+        int: Number of rows exported.
     """
     try:
         # Read configuration
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        DB_NAME = config['DATABASE']['DB_NAME']
-
-        # Configure logger
-        configure_logger(BASE_DIR)
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
 
         logger.info(f"Using database: {DB_NAME} for export_clients_without_email")
 
         # SQL query to select all columns for clients with NULL email_address
-        query = text("""
+        query = """
         SELECT *
         FROM clients
         WHERE email_address IS NULL
-        ORDER BY full_name;
-        """)
-
-        # Execute query and load into DataFrame
-        with engine.connect() as connection:
-            df = pd.read_sql(query, connection)
-            logger.info(f"Retrieved {len(df)} rows for clients with no email address")
+        ORDER BY full_name
+        """
 
-        # Save DataFrame to CSV
+        # Stream query results straight to CSV
         csv_file = BASE_DIR / 'data/clients/clients_without_email.csv'
         csv_file.parent.mkdir(exist_ok=True)
-        df.to_csv(csv_file, index=False)
-        logger.info(f"Saved clients without email data to {csv_file}")
+        rows = copy_query_to_csv(engine, query, csv_file)
+        logger.info(f"Saved {rows} rows for clients with no email address to {csv_file}")
 
-        return df
+        return rows
 
     except Exception as e:
         logger.error(f"Error in export_clients_without_email: {str(e)}")
@@ -257,21 +425,16 @@ def email_issues(config_path, engine):
         engine: SQLAlchemy engine for database connection.
 
     Returns:
-        pd.DataFrame: DataFrame with query results.
+        int: Number of rows exported.
     """
     try:
         # Read configuration
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        DB_NAME = config['DATABASE']['DB_NAME']
-
-        # Configure logger
-        configure_logger(BASE_DIR)
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
 
         logger.info(f"Using database: {DB_NAME} for email_issues")
 
         # SQL query to select all columns for clients with invalid email addresses
-        query = text("""
+        query = """
         SELECT *
         FROM clients
         WHERE email_address IS NOT NULL
@@ -280,21 +443,16 @@ def email_issues(config_path, engine):
             OR email_address LIKE '% %'  -- Contains spaces
             OR email_address ~ '[^a-zA-Z0-9.@_-]'  -- Contains invalid characters
         )
-        ORDER BY full_name;
-        """)
+        ORDER BY full_name
+        """
 
-        # Execute query and load into DataFrame
-        with engine.connect() as connection:
-            df = pd.read_sql(query, connection)
-            logger.info(f"Retrieved {len(df)} rows for clients with email issues")
-
-        # Save DataFrame to CSV
+        # Stream query results straight to CSV
         csv_file = BASE_DIR / 'data/clients/email_issues.csv'
         csv_file.parent.mkdir(exist_ok=True)
-        df.to_csv(csv_file, index=False)
-        logger.info(f"Saved clients with email issues data to {csv_file}")
+        rows = copy_query_to_csv(engine, query, csv_file)
+        logger.info(f"Saved {rows} rows for clients with email issues to {csv_file}")
 
-        return df
+        return rows
 
     except Exception as e:
         logger.error(f"Error in email_issues: {str(e)}")
@@ -309,41 +467,35 @@ def more_emails(config_path, engine):
         engine: SQLAlchemy engine for database connection.
 
     Returns:
-        pd.DataFrame: DataFrame with query results.
+        int: Number of rows exported.
     """
     try:
         # Read configuration
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        DB_NAME = config['DATABASE']['DB_NAME']
-
-        # Configure logger
-        configure_logger(BASE_DIR)
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
 
         logger.info(f"Using database: {DB_NAME} for more_emails")
 
-        # SQL query to select all columns for clients with multiple @ symbols in email
-        query = text("""
+        # SQL query to select all columns for clients with multiple @ symbols in email,
+        # one row per email_address keeping the first full_name
+        query = """
         SELECT *
-        FROM clients
-        WHERE email_address IS NOT NULL
-        AND email_address LIKE '%@%@%'
-        ORDER BY full_name;
-        """)
-
-        # Execute query and load into DataFrame
-        with engine.connect() as connection:
-            df = pd.read_sql(query, connection)
-            logger.info(f"Retrieved {len(df)} rows for clients with multiple @ symbols in email")
-
-        # Save DataFrame to CSV
+        FROM (
+            SELECT DISTINCT ON (email_address) *
+            FROM clients
+            WHERE email_address IS NOT NULL
+            AND email_address LIKE '%@%@%'
+            ORDER BY email_address, full_name
+        ) multiple_emails
+        ORDER BY full_name
+        """
+
+        # Stream query results straight to CSV
         csv_file = BASE_DIR / 'data/clients/multiple_emails.csv'
         csv_file.parent.mkdir(exist_ok=True)
-        df = df.drop_duplicates(subset='email_address', keep='first')
-        df.to_csv(csv_file, index=False)
-        logger.info(f"Saved clients with multiple @ emails data to {csv_file}")
+        rows = copy_query_to_csv(engine, query, csv_file)
+        logger.info(f"Saved {rows} rows for clients with multiple @ symbols in email to {csv_file}")
 
-        return df
+        return rows
 
     except Exception as e:
         logger.error(f"Error in more_emails: {str(e)}")
@@ -354,27 +506,17 @@ if __name__ == "__main__":
     # Default config path
     config_path = 'config.ini'
 
-    # Read configuration
-    config = configparser.ConfigParser()
-    config.read(config_path)
-    DB_USER = config['DATABASE']['DB_USER']
-    DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
-    DB_HOST = config['DATABASE']['DB_HOST']
-    DB_PORT = config['DATABASE']['DB_PORT']
-    DB_NAME = config['DATABASE']['DB_NAME']
+    # Configure logger once for all exports
+    configure_logger(BASE_DIR)
 
     # Create single database connection
-    DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
-    engine = create_engine(DB_URL)
-    logger.info(f"Connected to database: {DB_NAME}")
+    engine = get_engine(config_path)
+    logger.info(f"Connected to database: {load_config(config_path)['DATABASE']['DB_NAME']}")
 
     try:
-        # Export customers with invoices
-        df_customers = export_customers(config_path, engine)
-        # Export leads with estimates but no invoices
-        df_leads = export_leads(config_path, engine)
-        # Export all unique clients
-        df_all_clients = export_all_clients(config_path, engine)
+        # Export customers with invoices, leads with estimates but no invoices
+        # and all unique clients from a single query
+        counts = export_email_lists(config_path, engine)
         # Export clients with no email address
         # df_clients_without_email = export_clients_without_email(config_path, engine)
         # #Export clients with problematic email addresses
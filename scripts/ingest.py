@@ -1,16 +1,82 @@
 import pandas as pd
+import pyarrow as pa
+from pyarrow import compute as pc
+from pyarrow import csv as pa_csv
+from psycopg2.extras import execute_values
 from sqlalchemy import create_engine
 from pathlib import Path
 import configparser
 import logging
 from datetime import datetime
 import argparse
+import atexit
+import csv
 import gc
-gc.set_threshold(1000)  # Adjust garbage collection frequency
+import gzip
+import os
+from functools import lru_cache, partial, wraps
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import StringIO
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Problematic characters replaced with space: \0, \n, \r, \t, ', ", \, %, _, ;
+BAD_CHARS_TABLE = str.maketrans({c: ' ' for c in '\0\n\r\t\'"\\%_;'})
+# Same characters as a RE2 character class for the pyarrow compute kernels
+BAD_CHARS_PATTERN = r"""[\x00\n\r\t'"\\%_;]"""
+
+# Tables loaded with execute_values instead of COPY, e.g. tables with rules that COPY does not apply
+NO_COPY_TABLES = set()
+
+# Number of worker processes ingesting files concurrently in ingest_est_inv
+MAX_WORKERS = os.cpu_count() or 1
+# Size in bytes of the CSV blocks read and copied at a time by ingest_est_inv
+CHUNK_BYTES = 8 << 20
+# full_name values already checked against clients by this worker process
+_known_names = set()
+
+# Reads config.ini once per path, later calls return the cached parser
+@lru_cache(maxsize=4)
+def load_config(config_path):
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    return config
+
+# Creates one pooled engine per config file and process, disposed at exit
+@lru_cache(maxsize=4)
+def get_engine(config_path):
+    config = load_config(config_path)
+    DB_USER = config['DATABASE']['DB_USER']
+    DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
+    DB_HOST = config['DATABASE']['DB_HOST']
+    DB_PORT = config['DATABASE']['DB_PORT']
+    DB_NAME = config['DATABASE']['DB_NAME']
+    DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
+    engine = create_engine(DB_URL, pool_size=8, pool_pre_ping=True)
+    atexit.register(engine.dispose)
+    return engine
+
+# Runs the decorated ingest function with the cyclic garbage collector disabled.
+# The bulk loads allocate many short-lived pandas/str objects that hold no reference
+# cycles, so generational scans during the load are pure overhead; one collection
+# runs when the function returns
+def without_gc(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        gc.disable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            gc.enable()
+            gc.collect()
+    return wrapper
+
+# Returns the gzip compressed export (path + '.gz') when it exists, pandas/pyarrow decompress it on read
+def resolve_data_file(path):
+    gz_path = Path(f'{path}.gz')
+    return gz_path if gz_path.exists() else Path(path)
+
 # Function to configure logger for specific table
 def configure_logger(table_name, base_dir):
     logger = logging.getLogger(table_name)  # Unique logger per table
@@ -34,26 +100,97 @@ def configure_logger(table_name, base_dir):
     logger.addHandler(stream_handler)
     return logger
 
-def clean_dataframe(df, table_name, engine):
-    # Define problematic characters to replace with space
-    bad_chars = r'[\0\n\r\t\'"\\%_;]'  # Matches \0, \n, \r, \t, ', ", \, %, _, ;
-
-    # Replace bad characters in string columns only
+# Cleans problematic characters in the string columns of df, pure CPU work with no database access
+def clean_dataframe(df):
+    # Replace bad characters in string columns only, translate is a plain
+    # character table lookup so no regex runs per value
     string_columns = df.select_dtypes(include=['object']).columns
     for col in string_columns:
-        df[col] = df[col].str.replace(bad_chars, ' ', regex=True)
+        df[col] = df[col].str.translate(BAD_CHARS_TABLE)
 
     return df
 
+# Returns the distinct non-empty full_name values of df that are not in known_names,
+# the ones that still have to be checked against clients
+def validate_client_refs(df, known_names):
+    names = df['full_name'].dropna()
+    names = names[names.str.strip().ne('')]
+    return names[~names.isin(known_names)].unique().tolist()
+
+# Arrow counterpart of clean_dataframe: replaces the bad characters in every string column
+# of a pyarrow Table with one vectorized regex kernel per column
+def clean_table(table):
+    for i, field in enumerate(table.schema):
+        if pa.types.is_string(field.type):
+            cleaned = pc.replace_substring_regex(table.column(i), pattern=BAD_CHARS_PATTERN, replacement=' ')
+            table = table.set_column(i, field.name, cleaned)
+    return table
+
+# to_sql insertion method that streams the rows through PostgreSQL COPY FROM STDIN
+# instead of multi-VALUES INSERT statements.
+# CSV text format is used, FORMAT BINARY would need the exact column types of the target
+# table while every CSV column is read here as string (read_csv_chunks, ingest_clients_2),
+# so the server casts the text on load
+# constants: {column: value} appended to every row while writing the stream,
+# so constant columns are never materialized in the dataframe
+def psql_insert_copy(table, conn, keys, data_iter, constants=None):
+    constants = constants or {}
+    values = tuple(constants.values())
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cur:
+        buf = StringIO()
+        writer = csv.writer(buf)
+        writer.writerows(row + values for row in data_iter)
+        buf.seek(0)
+
+        columns = ', '.join(f'"{k}"' for k in [*keys, *constants])
+        table_name = f'{table.schema}.{table.name}' if table.schema else table.name
+        cur.copy_expert(f'COPY {table_name} ({columns}) FROM STDIN WITH CSV', buf)
+
+# to_sql insertion method for tables that can not be loaded with COPY (e.g. rules on the table):
+# execute_values packs each page of rows into a single multi-VALUES INSERT statement
+def psql_insert_values(table, conn, keys, data_iter, constants=None):
+    constants = constants or {}
+    values = tuple(constants.values())
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cur:
+        columns = ', '.join(f'"{k}"' for k in [*keys, *constants])
+        table_name = f'{table.schema}.{table.name}' if table.schema else table.name
+        execute_values(cur, f'INSERT INTO {table_name} ({columns}) VALUES %s',
+                       (row + values for row in data_iter), page_size=1000)
+
+# Appends df to table using COPY, or execute_values for the tables in NO_COPY_TABLES.
+# The table is created by to_sql if missing.
+# engine can also be an open Connection, the rows are then written in its transaction
+def copy_df(df, table, engine, constants=None):
+    method = psql_insert_values if table in NO_COPY_TABLES else psql_insert_copy
+    if constants:
+        method = partial(method, constants=constants)
+    df.to_sql(table, engine, if_exists='append', index=False, method=method)
+
+# Inserts the names that do not exist yet in clients as minimal records.
+# The names are sent as a single text[] parameter and the anti-join against clients
+# is done server-side, so the clients table never crosses the wire and all the new
+# clients of a chunk go in one statement instead of a temp table + COPY + INSERT.
+# Returns the number of inserted clients
+def insert_missing_clients(names, ingested_time, engine):
+    with engine.begin() as connection:
+        with connection.connection.cursor() as cur:
+            # Serializes the inserts of the ingest_est_inv worker processes until commit,
+            # so two files can not insert the same new client
+            cur.execute("SELECT pg_advisory_xact_lock(hashtext('clients'))")
+            cur.execute("""
+                INSERT INTO clients (full_name, ingested_time, source)
+                SELECT DISTINCT s.full_name, %s, 'joist'
+                FROM unnest(%s::text[]) AS s(full_name)
+                LEFT JOIN clients c ON c.full_name = s.full_name
+                WHERE c.full_name IS NULL
+            """, (ingested_time, list(names)))
+            return cur.rowcount
+
+@without_gc
 def ingest_clients_2(config_path, date_str):
-    config = configparser.ConfigParser()
-    config.read(config_path)
-    DB_USER = config['DATABASE']['DB_USER']
-    DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
-    DB_HOST = config['DATABASE']['DB_HOST']
-    DB_PORT = config['DATABASE']['DB_PORT']
-    DB_NAME = config['DATABASE']['DB_NAME']
-    DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
+    config = load_config(config_path)
     BASE_DIR = Path(config['PATHS']['BASE_DIR'])
 
     # Configure logger for clients
@@ -72,63 +209,177 @@ def ingest_clients_2(config_path, date_str):
         'Private Notes': 'private_notes',
         '**(Do not change this) Joist Client ID': 'joist_client_id'
     }
-    print(DB_URL)
-    engine = create_engine(DB_URL)
-    file = BASE_DIR / 'data' / 'clients' / f'clients.csv'
+    engine = get_engine(config_path)
+    file = resolve_data_file(BASE_DIR / 'data' / 'clients' / f'clients.csv')
     if file.exists():
         try:
-            # Read the tab-separated CSV file
-            df = pd.read_csv(file, sep=',', dtype=str, escapechar='\\')
-            logger.info(f"Read {file} with {len(df)} rows")
-
-            # Create df_unique (unique full_name, first occurrence) and df_dup (all duplicates)
-            df_unique = df.drop_duplicates(subset=['Name'], keep='first')
-            df_dup = df[df['Name'].duplicated(keep=False)]
-
+            # Read the CSV file with pyarrow, only the mapped columns are parsed.
+            # Address and Private Notes can hold quoted line breaks, newlines_in_values keeps the
+            # parallel blocks on record boundaries
+            table = pa_csv.read_csv(
+                file,
+                parse_options=pa_csv.ParseOptions(delimiter=',', escape_char='\\', newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=list(column_mappings),
+                    include_missing_columns=True,
+                    column_types={col: pa.string() for col in column_mappings},
+                    strings_can_be_null=True))
             # Rename columns using column_mappings
-            df_unique = df_unique.rename(columns=column_mappings)
-            df_dup = df_dup.rename(columns=column_mappings)
+            df = table.rename_columns([column_mappings[col] for col in table.column_names]).to_pandas()
+            logger.info(f"Read {file} with {len(df)} rows")
 
-            # Set ingested_time from date_str
+            df = clean_dataframe(df)
             ingested_time = pd.to_datetime(date_str, format='%Y_%m_%d')
-
-            # Add ingested_time for both DataFrames
-            df_unique['ingested_time'] = ingested_time
-            df_dup['ingested_time'] = ingested_time
-
-            # Clean and insert unique records into clients
-            if not df_unique.empty:
-                df_unique = clean_dataframe(df_unique, 'clients', engine)
-                df_unique.to_sql('clients', engine, if_exists='append', index=False, method='multi')
-                logger.info(f"Ingested {len(df_unique)} unique rows into clients")
-
-            # Clean and insert duplicate records into dup_name_clients
-            if not df_dup.empty:
-                df_dup = clean_dataframe(df_dup, 'dup_name_clients', engine)
-                df_dup.to_sql('dup_name_clients', engine, if_exists='append', index=False, method='multi')
-                logger.info(f"Ingested {len(df_dup)} duplicate rows into dup_name_clients")
-
-        except pd.errors.ParserError as e:
+            columns = ', '.join(f'"{col}"' for col in df.columns)
+
+            # Dedup is done server-side: the whole file is copied into a staging table, the first
+            # row of each full_name goes to clients (ON CONFLICT skips names already there, see
+            # migrations/add_clients_full_name_unique.sql) and every row of a repeated full_name
+            # goes to dup_name_clients
+            buf = StringIO()
+            df.to_csv(buf, index=False, header=False)
+            buf.seek(0)
+            with engine.begin() as connection:
+                with connection.connection.cursor() as cur:
+                    cur.execute(f"""
+                        CREATE TEMP TABLE clients_staging ON COMMIT DROP AS
+                        SELECT {columns} FROM clients WITH NO DATA;
+                        ALTER TABLE clients_staging ADD COLUMN row_num bigint GENERATED ALWAYS AS IDENTITY;
+                    """)
+                    cur.copy_expert(f"COPY clients_staging ({columns}) FROM STDIN WITH CSV", buf)
+                    cur.execute(f"""
+                        INSERT INTO clients ({columns}, ingested_time)
+                        SELECT DISTINCT ON (full_name) {columns}, %s
+                        FROM clients_staging
+                        ORDER BY full_name, row_num
+                        ON CONFLICT (full_name) DO NOTHING
+                    """, (ingested_time,))
+                    logger.info(f"Ingested {cur.rowcount} unique rows into clients")
+                    cur.execute(f"""
+                        INSERT INTO dup_name_clients ({columns}, ingested_time)
+                        SELECT {columns}, %s
+                        FROM clients_staging
+                        WHERE full_name IN (SELECT full_name FROM clients_staging GROUP BY 1 HAVING count(*) > 1)
+                        ORDER BY row_num
+                    """, (ingested_time,))
+                    logger.info(f"Ingested {cur.rowcount} duplicate rows into dup_name_clients")
+
+        except pa.ArrowInvalid as e:
             logger.error(f"CSV parsing error in {file}: {str(e)}")
-            with open(file, 'r') as f:
+            opener = gzip.open if str(file).endswith('.gz') else open
+            with opener(file, 'rt') as f:
                 for i, line in enumerate(f, 1):
-                    if i in range(1, 11):  # Log first 10 lines for debugging
-                        print(f"Line {i}: {line.strip()}")
+                    if i > 10:  # Log first 10 lines for debugging
+                        break
+                    print(f"Line {i}: {line.strip()}")
             raise
     else:
         logger.warning(f"No file found: {file}")
 
-    engine.dispose()
+# Reads a CSV file with the pyarrow streaming reader and yields one pyarrow Table per block of
+# CHUNK_BYTES, every column is kept as string like pd.read_csv(dtype=str).
+# Quoted values can span lines (clean_table strips the \n/\r), newlines_in_values keeps the
+# block boundaries on record boundaries
+def read_csv_chunks(file):
+    # The header is read first to type every column as string, gzip files are read through gzip.open
+    opener = gzip.open if str(file).endswith('.gz') else open
+    with opener(file, 'rt', encoding='utf-8-sig', newline='') as f:
+        header = next(csv.reader(f))
+    reader = pa_csv.open_csv(
+        file,
+        read_options=pa_csv.ReadOptions(block_size=CHUNK_BYTES),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={col: pa.string() for col in header},
+            strings_can_be_null=True))
+    for batch in reader:
+        yield pa.Table.from_batches([batch])
+
+# Yields the items of chunks while the next one is already being read in a background thread,
+# so parsing the next block overlaps with the COPY of the current one (both release the GIL)
+def prefetch(chunks):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, chunks, None)
+        while (chunk := future.result()) is not None:
+            future = executor.submit(next, chunks, None)
+            yield chunk
+
+# Sets up an ingest_est_inv worker process: an engine inherited from the parent on fork must not
+# reuse the parent connections, and spawned workers need the table logger configured
+def _init_worker(table_name, config_path):
+    get_engine(config_path).dispose(close=False)
+    configure_logger(table_name, Path(load_config(config_path)['PATHS']['BASE_DIR']))
+
+# Ingests a single estimates/invoices CSV file, called from the ingest_est_inv worker processes.
+# The file is read in blocks of CHUNK_BYTES so memory stays bounded by the block size.
+# All blocks are copied in one transaction, a failure rolls back the whole file and is re-raised
+@without_gc
+def _ingest_one(file, table_name, column_mappings, config_path, ingested_time):
+    print(f"Ingesting file: {file}")
+    engine = get_engine(config_path)
+    logger = logging.getLogger(table_name)
+    current_time = datetime.now()
+    # ingested_time is added to every row by the COPY stream
+    constants = {'ingested_time': ingested_time}
+
+    # Ensure all required columns are present
+    required_columns = {
+        'estimates': ['estimate_number', 'full_name', 'subtotal', 'tax', 'total', 'date_issued', 'date_created'],
+        'invoices': ['invoice_number', 'full_name', 'subtotal', 'tax', 'total', 'date_issued', 'date_created',
+                     'payment_received_less_refunds']
+    }
+
+    # Renamed header and full column list, every chunk of the file has the same columns
+    # so they are computed once
+    new_columns = None
+    all_columns = None
+    try:
+        with engine.begin() as connection:
+            for table in prefetch(read_csv_chunks(file)):
+                # Clean the string columns with the Arrow kernels before checking for missing clients
+                df = clean_table(table).to_pandas()
+                if new_columns is None:
+                    logger.info(f"mishoo: {df.head()}")
+                    new_columns = [column_mappings.get(col, col) for col in df.columns]
+                    all_columns = new_columns + [col for col in required_columns[table_name] if col not in new_columns]
+                df.columns = new_columns
+
+                # Missing required columns are added in a single reindex, they are written as NULL
+                if len(all_columns) > len(new_columns):
+                    df = df.reindex(columns=all_columns)
+
+                # Insert minimal records for the full_name values missing in clients before the chunk
+                # is copied, so the clients exist for the full_name foreign key.
+                # Names already checked by a previous chunk or file are skipped with plain set lookups.
+                # The clients are committed on their own, the advisory lock is not held for the whole file
+                candidate_names = validate_client_refs(df, _known_names)
+                if candidate_names:
+                    # The names are anti-joined against clients on the server
+                    inserted = insert_missing_clients(candidate_names, current_time, engine)
+                    _known_names.update(candidate_names)
+                    logger.info(f"Inserted {inserted} new clients from {table_name}")
+
+                # Drop rows with null or empty full_name and log dropped rows
+                initial_rows = len(df)
+                has_name = df['full_name'].notnull() & df['full_name'].str.strip().ne('')
+                dropped_rows = df[~has_name]
+                df = df[has_name]
+                dropped_count = initial_rows - len(df)
+                if dropped_count > 0:
+                    logger.warning(
+                        f"Dropped {dropped_count} {table_name} rows with null or empty full_name from {file}:")
+                    # Log the full data of dropped rows as a single CSV record
+                    logger.warning("Dropped rows:\n%s", dropped_rows.to_csv(index=False))
+
+                copy_df(df, table_name, connection, constants)
+    except Exception as e:
+        logger.error(f"Failed to write {file} to {table_name}: {str(e)}")
+        raise
+
+    logger.info(f"Ingested {file} into {table_name}")
 
 def ingest_est_inv(table_name, config_path, date_str):
-    config = configparser.ConfigParser()
-    config.read(config_path)
-    DB_USER = config['DATABASE']['DB_USER']
-    DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
-    DB_HOST = config['DATABASE']['DB_HOST']
-    DB_PORT = config['DATABASE']['DB_PORT']
-    DB_NAME = config['DATABASE']['DB_NAME']
-    DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
+    config = load_config(config_path)
     BASE_DIR = Path(config['PATHS']['BASE_DIR'])
 
     # Configure logger for table_name
@@ -155,75 +406,34 @@ def ingest_est_inv(table_name, config_path, date_str):
             'Payment Received Less Refunds': 'payment_received_less_refunds'
         }
     }
-    # print(DB_URL)
-    engine = create_engine(DB_URL)
-    files = list((BASE_DIR / 'data' / table_name).glob('*.csv'))
+    # Plain and gzip compressed monthly exports, like resolve_data_file the .gz copy is read
+    # instead of a plain file with the same name so no month is loaded twice
+    data_dir = BASE_DIR / 'data' / table_name
+    gz_files = list(data_dir.glob('*.csv.gz'))
+    compressed = {gz_file.name[:-len('.gz')] for gz_file in gz_files}
+    files = [file for file in data_dir.glob('*.csv') if file.name not in compressed] + gz_files
     logger.info(f"Found {len(files)} CSV files for {table_name}")
-    for file in files:
-        print(f"Ingesting file: {file}")
-        df = pd.read_csv(file, sep=',', dtype=str)
-        logger.info(f"mishoo: {df.head()}")
-        df = df.rename(columns=column_mappings[table_name])
-        current_time = datetime.now()
-
-        # Ensure all required columns are present, fill missing with None
-        required_columns = {
-            'estimates': ['estimate_number', 'full_name', 'subtotal', 'tax', 'total', 'date_issued', 'date_created'],
-            'invoices': ['invoice_number', 'full_name', 'subtotal', 'tax', 'total', 'date_issued', 'date_created',
-                         'payment_received_less_refunds']
-        }
-        for col in required_columns[table_name]:
-            if col not in df.columns:
-                df[col] = None
-
-        # Clean dataframe before checking for missing clients
-        df = clean_dataframe(df, table_name, engine)
-
-        # Set ingested_time from date_str
-        ingested_time = pd.to_datetime(date_str, format='%Y_%m_%d')
-
-        # Add ingested_time
-        df['ingested_time'] = ingested_time
-
-        # Check for missing full_name in clients and insert minimal records
-        existing_clients = pd.read_sql("SELECT full_name FROM clients", engine)
-        missing_names = df[~df['full_name'].isin(existing_clients['full_name'])]['full_name'].unique()
-        if len(missing_names) > 0:
-            # Filter out null or empty full_name values and deduplicate
-            missing_names = [name for name in missing_names if pd.notnull(name) and name.strip() != '']
-            missing_names = pd.Series(missing_names).drop_duplicates().tolist()
-            if missing_names:
-                logger.info(f"Inserting {len(missing_names)} new clients from invoices")
-                new_clients = pd.DataFrame({
-                    'full_name': missing_names,
-                    'ingested_time': current_time,
-                    'source': 'joist'
-                })
-                new_clients = clean_dataframe(new_clients, table_name, engine)
-                new_clients.to_sql('clients', engine, if_exists='append', index=False, method='multi')
-
-        # Drop rows with null or empty full_name and log dropped rows
-        initial_rows = len(df)
-        dropped_rows = df[df['full_name'].isnull() | (df['full_name'].str.strip() == '')]
-        df = df[df['full_name'].notnull() & (df['full_name'].str.strip() != '')]
-        dropped_count = initial_rows - len(df)
-        if dropped_count > 0:
-            logger.warning(
-                f"Dropped {dropped_count} {table_name} rows with null or empty full_name from {file}:")
-            # Log the full data of dropped rows
-            for _, row in dropped_rows.iterrows():
-                logger.warning(f"Dropped row: {row.to_dict()}")
-
-        df = clean_dataframe(df, table_name, engine)
-
-        try:
-            df.to_sql(table_name, engine, if_exists='append', index=False, method='multi')
-            logger.info(f"Ingested {file} into {table_name}")
-        except Exception as e:
-            logger.error(f"Failed to write {file} to {table_name}: {str(e)}")
-            continue
-
-    engine.dispose()
+    # Set ingested_time from date_str, once for all files
+    ingested_time = pd.to_datetime(date_str, format='%Y_%m_%d')
+    # Each worker process creates its own engine, the clients table itself is never downloaded,
+    # only the names of the files go to the server
+    if files:
+        with ProcessPoolExecutor(max_workers=min(MAX_WORKERS, len(files)), initializer=_init_worker,
+                                 initargs=(table_name, config_path)) as executor:
+            futures = {file: executor.submit(_ingest_one, file, table_name, column_mappings[table_name],
+                                             config_path, ingested_time)
+                       for file in files}
+            # Every file is loaded or rolled back on its own, the failed ones are reported together
+            failed = []
+            for file, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Ingest of {file} rolled back: {str(e)}")
+                    failed.append(file)
+        if failed:
+            raise RuntimeError(f"Failed to ingest {len(failed)} of {len(files)} {table_name} files: "
+                               f"{', '.join(str(f) for f in failed)}")
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Ingest CSV data into PostgreSQL')
@@ -1,37 +1,80 @@
 import pandas as pd
 import configparser
+import atexit
+import csv
+from functools import lru_cache
+from io import StringIO
 from sqlalchemy import create_engine, text
 from datetime import datetime
 
+# Problematic characters replaced with space: \0, \n, \r, \t, ', ", \, %, _, ;
+BAD_CHARS_TABLE = str.maketrans({c: ' ' for c in '\0\n\r\t\'"\\%_;'})
+
+# Reads config.ini once per path, later calls return the cached parser
+@lru_cache(maxsize=4)
+def load_config(config_path):
+    config = configparser.ConfigParser()
+    if not config.read(config_path):
+        raise FileNotFoundError(f"Config file not found at {config_path}")
+    return config
+
+# Creates one pooled engine per config file, reused by every ingest call and disposed at exit
+@lru_cache(maxsize=4)
+def get_engine(config_path):
+    config = load_config(config_path)
+    DB_USER = config['DATABASE']['DB_USER']
+    DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
+    DB_HOST = config['DATABASE']['DB_HOST']
+    DB_PORT = config['DATABASE']['DB_PORT']
+    DB_NAME = config['DATABASE']['DB_NAME']
+    DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
+    engine = create_engine(DB_URL, pool_size=8, pool_pre_ping=True)
+    atexit.register(engine.dispose)
+    return engine
+
 # Cleans problematic characters for the database
 # Args: df = dataframe to clean
 #       cols = string columns hand-picked for each df
 
 def clean_df_cols(df, cols):
-    # Define problematic characters to replace with space
-    bad_chars = r'[\0\n\r\t\'"\\%_;]'  # Matches \0, \n, \r, \t, ', ", \, %, _, ;
-
-    # Replace bad characters in cols only
+    # Replace bad characters in cols only, translate is a plain character
+    # table lookup so no regex runs per value
     for col in cols:
-        df[col] = df[col].str.replace(bad_chars, ' ', regex=True).str.strip()
+        df[col] = df[col].str.translate(BAD_CHARS_TABLE).str.strip()
 
     return df
 
+# to_sql insertion method that streams the rows through PostgreSQL COPY FROM STDIN
+# instead of INSERT statements.
+# CSV text format is used: the frames carry pandas/Arrow dtypes (int64 ids, dates, nullable
+# strings) that do not map one to one to the table column types, FORMAT BINARY would need each
+# value encoded in the exact type of its column while the text is cast by the server on load
+def psql_insert_copy(table, conn, keys, data_iter):
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cur:
+        buf = StringIO()
+        writer = csv.writer(buf)
+        writer.writerows(data_iter)
+        buf.seek(0)
+
+        columns = ', '.join(f'"{k}"' for k in keys)
+        table_name = f'{table.schema}.{table.name}' if table.schema else table.name
+        cur.copy_expert(f'COPY {table_name} ({columns}) FROM STDIN WITH CSV', buf)
+
+# Appends df to table using COPY, the table is created by to_sql if missing
+def copy_df(df, table, engine):
+    df.to_sql(table, engine, if_exists='append', index=False, method=psql_insert_copy)
+
 def ingest_estimate_invoice(df, table_name, config_path, date, logger):
     """
     Shared helper method to handle the core data ingestion logic,
     now accepting a DataFrame and logger directly.
     """
-    config = configparser.ConfigParser()
-    if not config.read(config_path):
-        logger.error(f"Config file not found at {config_path}")
-        raise FileNotFoundError(f"Config file not found at {config_path}")
-    DB_USER = config['DATABASE']['DB_USER']
-    DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
-    DB_HOST = config['DATABASE']['DB_HOST']
-    DB_PORT = config['DATABASE']['DB_PORT']
-    DB_NAME = config['DATABASE']['DB_NAME']
-    DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
+    try:
+        engine = get_engine(config_path)
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        raise
 
     column_mappings = {
         'estimates': {
@@ -46,8 +89,7 @@ def ingest_estimate_invoice(df, table_name, config_path, date, logger):
         }
     }
 
-    engine = create_engine(DB_URL)
-    logger.info(f"Connected to database: {DB_URL.replace(DB_PASSWORD, '****')}")
+    logger.info(f"Connected to database: {engine.url.render_as_string(hide_password=True)}")
 
     print(column_mappings[table_name])
     # Rename columns based on the table name
@@ -72,26 +114,24 @@ def ingest_estimate_invoice(df, table_name, config_path, date, logger):
     try:
         cols = ['full_name']
         df = clean_df_cols(df, cols)
-        df.to_sql(table_name, engine, if_exists='append', index=False, method='multi')
+        copy_df(df, table_name, engine)
         logger.info(f"Ingested {len(df)} rows into {table_name}")
     except Exception as e:
         logger.error(f"Failed to write data to {table_name}: {str(e)}")
         raise
-    finally:
-        engine.dispose()
 
 def ingest_clients_with_estimates(estimates, clients, config_path, ingestion_date, logger):
     # Load configuration
-    config = configparser.ConfigParser()
-    if not config.read(config_path):
-        logger.error(f"Config file not found at {config_path}")
-        raise FileNotFoundError(f"Config file not found at {config_path}")
-    DB_USER = config['DATABASE']['DB_USER']
-    DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
-    DB_HOST = config['DATABASE']['DB_HOST']
-    DB_PORT = config['DATABASE']['DB_PORT']
-    DB_NAME = config['DATABASE']['DB_NAME']
-    DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
+    try:
+        engine = get_engine(config_path)
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        raise
+
+    # Arrow-backed dtypes: the repeated full_name strings are stored once in Arrow buffers
+    # instead of one Python object per row, and merge/isin run in Arrow
+    clients = clients.convert_dtypes(dtype_backend='pyarrow')
+    estimates = estimates.convert_dtypes(dtype_backend='pyarrow')
 
     # Rename columns in clients to match PostgreSQL schema
     column_mappings = {
@@ -129,26 +169,25 @@ def ingest_clients_with_estimates(estimates, clients, config_path, ingestion_dat
     clients = clients.drop(columns=['date_created'], errors='ignore')
     logger.info(f"Populated join_date for {len(clients[~clients['join_date'].isna()])} clients")
 
-    # Create engine
     try:
-        engine = create_engine(DB_URL)
-        logger.info(f"Connected to database: {DB_URL.replace(DB_PASSWORD, '****')}")
-        # Load existing clients from database
-        query = text("SELECT * FROM clients;")
+        logger.info(f"Connected to database: {engine.url.render_as_string(hide_password=True)}")
+        # Load existing client names from database, only full_name is used
+        query = text("SELECT full_name FROM clients;")
         with engine.connect() as connection:
-            db_clients = pd.read_sql(query, connection)
+            db_clients = pd.read_sql(query, connection, dtype_backend='pyarrow')
             logger.info(f"Retrieved {len(db_clients)} rows for clients")
 
-            # Create sets for fast lookups
-            db_names = set(db_clients['full_name'])
-            client_names = set(clients['full_name'])
+            client_names = set(clients['full_name'].dropna())
 
-            # Find new full_names from estimates not in db_clients
-            new_names = set(estimates['full_name']) - db_names
+            # Find new full_names from estimates not in db_clients, the membership test runs
+            # on the Arrow columns and only the distinct new names become Python strings
+            estimate_names = pd.Series(estimates['full_name'].dropna().unique())
+            new_names = set(estimate_names[~estimate_names.isin(db_clients['full_name'])])
             logger.info(f"New clients: {len(new_names)}")
 
-            # Check for case mismatches
-            mismatched_names = [name for name in new_names if name.lower() in [n.lower() for n in db_names.union(client_names)]]
+            # Check for case mismatches, the known names are lowercased once into a set
+            lowered = set(db_clients['full_name'].dropna().str.lower()) | {n.lower() for n in client_names}
+            mismatched_names = [name for name in new_names if name.lower() in lowered]
             if mismatched_names:
                 logger.warning(f"Potential case mismatch for full_name: {mismatched_names}")
 
@@ -176,12 +215,11 @@ def ingest_clients_with_estimates(estimates, clients, config_path, ingestion_dat
                 cols = ['full_name', 'email_address', 'address', 'address_2', 'city', 'state_province', 'private_notes']
                 to_insert = clean_df_cols(to_insert, cols)
                 try:
-                    to_insert.to_sql('clients', engine, if_exists='append', index=False)
+                    copy_df(to_insert, 'clients', engine)
                     logger.info(f"Inserted {len(to_insert)} new clients")
                 except Exception as e:
                     logger.error(f"Failed to insert clients: {str(e)}")
                     raise
-        engine.dispose()
 
     except Exception as e:
         logger.error(f"Database error: {str(e)}")
@@ -0,0 +1,9 @@
+-- Unique index on clients.full_name.
+-- ingest_clients_2 in ingest.py inserts the clients file with
+-- INSERT ... ON CONFLICT (full_name) DO NOTHING, which needs this index as the arbiter.
+-- Names repeated in the clients file are kept in dup_name_clients, not in clients.
+-- Creating the index fails if clients already holds duplicate full_name values,
+-- list them first with: SELECT full_name FROM clients GROUP BY 1 HAVING count(*) > 1;
+-- Run once against the CRM database: psql -d <DB_NAME> -f add_clients_full_name_unique.sql
+CREATE UNIQUE INDEX IF NOT EXISTS clients_full_name_key
+ON clients (full_name);
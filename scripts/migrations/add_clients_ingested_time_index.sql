@@ -0,0 +1,6 @@
+-- Index on clients.ingested_time.
+-- update_client_join_date in transfrom.py selects the clients of one ingestion day with a
+-- half-open range on ingested_time, which this index serves as a range scan.
+-- Run once against the CRM database: psql -d <DB_NAME> -f add_clients_ingested_time_index.sql
+CREATE INDEX IF NOT EXISTS clients_ingested_time_idx
+ON clients (ingested_time);
@@ -0,0 +1,10 @@
+-- Index on estimates (full_name, date_issued).
+-- The agg CTE of update_client_join_date in transfrom.py takes MIN(date_issued) per full_name,
+-- with date_issued in the index that minimum is read from the index without visiting the heap.
+-- It also serves every lookup by full_name, so it replaces estimates_full_name_idx
+-- (add_estimates_full_name_index.sql).
+-- Run once against the CRM database: psql -d <DB_NAME> -f add_estimates_full_name_date_index.sql
+CREATE INDEX IF NOT EXISTS estimates_full_name_date_idx
+ON estimates (full_name, date_issued);
+
+DROP INDEX IF EXISTS estimates_full_name_idx;
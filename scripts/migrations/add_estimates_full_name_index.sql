@@ -0,0 +1,6 @@
+-- Index on estimates.full_name.
+-- update_client_join_date in transfrom.py joins the earliest estimate of each client
+-- to clients on full_name.
+-- Run once against the CRM database: psql -d <DB_NAME> -f add_estimates_full_name_index.sql
+CREATE INDEX IF NOT EXISTS estimates_full_name_idx
+ON estimates (full_name);
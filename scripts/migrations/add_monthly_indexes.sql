@@ -0,0 +1,17 @@
+-- Covering indexes for the monthly stats queries in transfrom.py (stats_month_batched).
+-- Those queries group by TO_CHAR(<date>, 'YYYY-MM') over the whole table, so they read every
+-- row either way; with these indexes Postgres can answer them with an index-only scan of the
+-- date (and summed) columns instead of reading the full rows of the heap.
+-- An expression index on date_trunc('month', <date>) is not used: for date columns
+-- date_trunc resolves to the timestamptz variant, which is not immutable and can not be indexed.
+-- INCLUDE needs PostgreSQL 11 or later.
+-- Run once against the CRM database: psql -d <DB_NAME> -f add_monthly_indexes.sql
+CREATE INDEX IF NOT EXISTS clients_join_date_idx
+ON clients (join_date)
+WHERE join_date IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS estimates_date_issued_idx
+ON estimates (date_issued);
+
+CREATE INDEX IF NOT EXISTS invoices_date_issued_idx
+ON invoices (date_issued) INCLUDE (total, full_name);
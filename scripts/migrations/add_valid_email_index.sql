@@ -0,0 +1,13 @@
+-- Partial index over the clients with a valid email_address.
+-- The predicate matches the WHERE clause of export_customers, export_leads and
+-- export_all_clients in exports.py, so those exports read the index instead of
+-- scanning clients. The column order matches their DISTINCT ON (email_address) ... ORDER BY
+-- email_address, full_name, which lets Postgres use an index-only scan.
+-- Run once against the CRM database: psql -d <DB_NAME> -f add_valid_email_index.sql
+CREATE INDEX IF NOT EXISTS clients_valid_email_idx
+ON clients (email_address, full_name)
+WHERE email_address IS NOT NULL
+AND email_address NOT LIKE '%@%@%'
+AND email_address NOT LIKE '%,%'
+AND email_address NOT LIKE '% %'
+AND email_address !~ '[^a-zA-Z0-9.@_-]';
@@ -1,23 +1,48 @@
+import argparse
+import atexit
+import calendar
 import configparser
+import hashlib
 import logging
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-from matplotlib.patches import Rectangle
 from sqlalchemy import create_engine, text
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # CSV files are written with pandas when pyarrow is not installed
+    pa = None
+
 # Set BASE_DIR to the directory of the current script
 BASE_DIR = Path(__file__).parent.parent
 
-# Configure logger
-logging.basicConfig(level=logging.INFO)
+# Cached plot renders (plots/.plot_cache): bump the version when the plotting code changes the
+# image, so old renders are not served again; only the most recently used files are kept
+PLOT_CACHE_VERSION = 1
+PLOT_CACHE_MAX_FILES = 32
+
+# Configure logger, handlers are added by configure_logger
 logger = logging.getLogger(__name__)
 
+# Background writer for the stats CSV files, so the next query does not wait for the disk.
+# Pending writes are finished before the interpreter exits
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+atexit.register(_IO_POOL.shutdown, wait=True)
+
 
 def configure_logger(base_dir):
-    logger.handlers.clear()  # Clear existing handlers to avoid duplicates
+    # Handlers are added on the first call only, later calls reuse them
+    if getattr(logger, '_configured', False):
+        return logger
+    logger._configured = True
     logger.setLevel(logging.INFO)
 
     log_dir = Path(base_dir) / 'logs'
@@ -36,59 +61,197 @@ def configure_logger(base_dir):
     logger.addHandler(stream_handler)
     return logger
 
+
+def write_csv(df, csv_file, use_arrow=True):
+    """
+    Saves a DataFrame to CSV, run on _IO_POOL by the stats queries.
+    The Arrow CSV writer formats whole columns in C++. It is only used for frames of string and
+    integer columns whose values need no quoting, which it writes exactly like to_csv (Arrow
+    formats floats and timestamps differently). Everything else is written by pandas to_csv.
+    Paths ending in '.gz' are gzip compressed.
+
+    Args:
+        df (pd.DataFrame): DataFrame to save, it must not be modified after submitting.
+        csv_file (Path): Output CSV path, e.g. 'stats.csv' or 'stats.csv.gz'.
+        use_arrow (bool): Write with pyarrow.csv when available (default True).
+    """
+    try:
+        if use_arrow and pa is not None:
+            try:
+                write_csv_arrow(df, csv_file)
+                logger.info(f"Saved DataFrame to {csv_file}")
+                return
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+                pass  # a column or value Arrow can not write like to_csv, pandas writes the file
+        # compression is inferred from the suffix, rows are formatted in chunks
+        df.to_csv(csv_file, index=False, lineterminator='\n', chunksize=50000)
+        logger.info(f"Saved DataFrame to {csv_file}")
+    except Exception as e:
+        logger.error(f"Error saving {csv_file}: {str(e)}")
+        raise
+
+
+def write_csv_arrow(df, csv_file):
+    """
+    Writes a DataFrame of string and integer columns with the Arrow CSV writer, in the same
+    format as to_csv(index=False): the header comes from pandas and values are never quoted.
+
+    Args:
+        df (pd.DataFrame): DataFrame to save.
+        csv_file (Path): Output CSV path, gzip compressed if it ends in '.gz'.
+
+    Raises:
+        TypeError: If a column is not string or integer.
+        pa.ArrowInvalid: If a value would need quoting.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for field in table.schema:
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)
+                or pa.types.is_integer(field.type) or pa.types.is_null(field.type)):
+            raise TypeError(f"column {field.name} has type {field.type}")
+    header = df.head(0).to_csv(index=False, lineterminator='\n').encode()
+    write_options = pa_csv.WriteOptions(include_header=False, quoting_style='none')
+    compression = 'gzip' if str(csv_file).endswith('.gz') else None
+    with pa.output_stream(str(csv_file), compression=compression) as out:
+        out.write(header)
+        pa_csv.write_csv(table, out, write_options=write_options)
+
+
+@lru_cache(maxsize=None)
+def load_config(config_path):
+    """
+    Reads the config.ini file once, later calls with the same path return the cached parser.
+
+    Args:
+        config_path (str): Path to the config.ini file.
+
+    Returns:
+        configparser.ConfigParser: Parsed configuration.
+    """
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    return config
+
+
+@lru_cache(maxsize=None)
+def get_engine(config_path):
+    """
+    Creates the SQLAlchemy engine once per config file, its connection pool is shared by the
+    update and stats queries and disposed at interpreter exit.
+
+    Args:
+        config_path (str): Path to the config.ini file.
+
+    Returns:
+        Engine: SQLAlchemy engine for database connection.
+    """
+    config = load_config(config_path)
+    DB_USER = config['DATABASE']['DB_USER']
+    DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
+    DB_HOST = config['DATABASE']['DB_HOST']
+    DB_PORT = config['DATABASE']['DB_PORT']
+    DB_NAME = config['DATABASE']['DB_NAME']
+    DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
+    engine = create_engine(DB_URL, pool_size=5, max_overflow=5, pool_pre_ping=True, pool_recycle=1800)
+    atexit.register(engine.dispose)
+    return engine
+
 # db query functions --> update
 def update_client_join_date(config_path, ingestion_date):
     """
     Updates the join_date column in the clients table with the earliest estimate date
     for clients with a specific ingestion_date. If no estimates exist, join_date remains NULL.
+    Several dates (e.g. a backfill) are updated with a single statement bound to a date array.
 
     Args:
         config_path (str): Path to the config.ini file.
-        ingestion_date (str): Date in 'YYYY-MM-DD' format to filter clients by ingested_time.
+        ingestion_date (str or list): Date in 'YYYY-MM-DD' format, or a list of them, to filter
+            clients by ingested_time.
     """
     try:
         # Read configuration
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        DB_USER = config['DATABASE']['DB_USER']
-        DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
-        DB_HOST = config['DATABASE']['DB_HOST']
-        DB_PORT = config['DATABASE']['DB_PORT']
-        DB_NAME = config['DATABASE']['DB_NAME']
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
 
         # Configure logger
         configure_logger(BASE_DIR)
 
-        # Create database connection
-        DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
-        engine = create_engine(DB_URL)
+        # Reuse the cached engine and its pooled connections
+        engine = get_engine(config_path)
         logger.info(f"Connected to database: {DB_NAME}")
 
-        # SQL query to update join_date
+        # SQL query to update join_date, the earliest estimate of every client is computed
+        # in one aggregate and joined instead of a correlated subquery per client.
+        # The aggregate only reads the estimates of the clients ingested on the given dates,
+        # each date is matched with a half-open range so an index on ingested_time can be used
         query = text("""
-        UPDATE clients c
-        SET join_date = (
-            SELECT MIN(e.date_issued)
+        WITH days AS (
+            SELECT unnest(CAST(:ingestion_dates AS date[])) AS day
+        ), cand AS (
+            SELECT DISTINCT c.full_name
+            FROM clients c
+            JOIN days ON c.ingested_time >= days.day
+            AND c.ingested_time < days.day + INTERVAL '1 day'
+        ), agg AS (
+            SELECT e.full_name, MIN(e.date_issued) AS min_date
             FROM estimates e
-            WHERE e.full_name = c.full_name
+            JOIN cand ON cand.full_name = e.full_name
+            GROUP BY e.full_name
         )
-        WHERE c.ingested_time::date = :ingestion_date;
+        UPDATE clients c
+        SET join_date = agg.min_date
+        FROM agg
+        WHERE agg.full_name = c.full_name
+        AND EXISTS (
+            SELECT 1 FROM days
+            WHERE c.ingested_time >= days.day
+            AND c.ingested_time < days.day + INTERVAL '1 day'
+        );
         """)
 
-        # Execute the update query
-        with engine.connect() as connection:
-            result = connection.execute(query, {"ingestion_date": ingestion_date})
-            connection.commit()
-            logger.info(f"Updated join_date for clients with ingestion_date {ingestion_date}")
+        ingestion_dates = [ingestion_date] if isinstance(ingestion_date, str) else list(ingestion_date)
+        days = [datetime.strptime(d, '%Y-%m-%d').date() for d in ingestion_dates]
+
+        # Execute the update query in one transaction, committed (or rolled back) when the block exits.
+        # join_date is recomputed from estimates on every run, so the commit does not wait for
+        # the WAL flush, SET LOCAL only applies to this transaction
+        with engine.begin() as connection:
+            connection.execute(text("SET LOCAL synchronous_commit = off"))
+            result = connection.execute(query, {"ingestion_dates": days})
+            logger.info(f"Updated join_date for clients with ingestion_date {', '.join(ingestion_dates)}")
             logger.info(f"Rows affected: {result.rowcount}")
 
     except Exception as e:
         logger.error(f"Error updating join_date: {str(e)}")
         raise
 
-    finally:
-        engine.dispose()
-        logger.info("Database connection closed.")
+def update_client_join_dates_parallel(config_path, ingestion_dates, workers=4):
+    """
+    Backfills join_date for many ingestion dates by splitting the dates into one batch per
+    worker and running update_client_join_date for each batch on its own pooled connection.
+    full_name is unique in clients, so every client belongs to a single ingestion date and the
+    batches update disjoint rows without waiting on each other's locks.
+
+    Args:
+        config_path (str): Path to the config.ini file.
+        ingestion_dates (list): Dates in 'YYYY-MM-DD' format.
+        workers (int): Number of concurrent UPDATE statements (default 4), kept within the
+            engine pool size.
+    """
+    ingestion_dates = sorted(set(ingestion_dates))
+    if not ingestion_dates:
+        return
+    # Handlers are added and the engine is created before the threads start, lru_cache does not
+    # stop concurrent first calls from each creating their own engine and pool
+    configure_logger(BASE_DIR)
+    get_engine(config_path)
+
+    workers = max(1, min(workers, len(ingestion_dates)))
+    batches = [ingestion_dates[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(update_client_join_date, config_path, batch) for batch in batches]
+        # result() re-raises the first failure, batches that already committed stay committed
+        for future in futures:
+            future.result()
 
 # db query functions --> selects
 def clients_join_month(config_path):
@@ -104,24 +267,17 @@ def clients_join_month(config_path):
     """
     try:
         # Read configuration
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        DB_USER = config['DATABASE']['DB_USER']
-        DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
-        DB_HOST = config['DATABASE']['DB_HOST']
-        DB_PORT = config['DATABASE']['DB_PORT']
-        DB_NAME = config['DATABASE']['DB_NAME']
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
 
         # Configure logger
         configure_logger(BASE_DIR)
 
-        # Create database connection
-        DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
-        engine = create_engine(DB_URL)
+        # Reuse the cached engine and its pooled connections
+        engine = get_engine(config_path)
         logger.info(f"Connected to database: {DB_NAME} for clients_join_month")
 
         # SQL query to count clients joined per month
-        query = text("""
+        query = """
         SELECT 
             TO_CHAR(join_date, 'YYYY-MM') AS month,
             COUNT(*) AS clients_joined
@@ -129,29 +285,30 @@ def clients_join_month(config_path):
         WHERE join_date IS NOT NULL
         GROUP BY TO_CHAR(join_date, 'YYYY-MM')
         ORDER BY month;
-        """)
+        """
 
-        # Execute query and load into DataFrame
-        with engine.connect() as connection:
-            df = pd.read_sql(query, connection)
-            logger.info(f"Retrieved {len(df)} rows from clients_joined_per_month query")
-
-        # Save DataFrame to CSV
+        # Stream the result straight into the CSV file with COPY ... TO STDOUT, no Python
+        # row objects are built for it
         csv_file = BASE_DIR / 'data/clients/clients_per_month.csv'
-        df.to_csv(csv_file, index=False)
-        logger.info(f"Saved DataFrame to {csv_file}")
+        connection = engine.raw_connection()
+        try:
+            with connection.cursor() as cur, open(csv_file, 'w', newline='') as f:
+                cur.copy_expert(f"COPY ({query.strip().rstrip(';')}) TO STDOUT WITH CSV HEADER", f)
+        finally:
+            connection.close()
+        logger.info(f"Saved query result to {csv_file}")
+
+        # The small monthly CSV is loaded back only for plotting
+        df = pd.read_csv(csv_file, dtype={'month': str, 'clients_joined': 'int32'})
+        logger.info(f"Retrieved {len(df)} rows from clients_joined_per_month query")
 
-        return df
+        return add_month_columns(df)
 
     except Exception as e:
         logger.error(f"Error in clients_join_month: {str(e)}")
         raise
 
-    finally:
-        engine.dispose()
-        logger.info("Database connection closed.")
-
-def stats_month(config_path, sql_query, table, csv_filename):
+def stats_month(config_path, sql_query, table, csv_filename, chunksize=None):
     """
     Queries data based on a SQL statement, saves it as a DataFrame, exports to CSV, and plots it.
 
@@ -160,53 +317,120 @@ def stats_month(config_path, sql_query, table, csv_filename):
         sql_query (str): SQL statement to execute.
         table (str): Name of the table being queried.
         csv_filename (str): Path to save the CSV output relative to BASE_DIR.
+        chunksize (int, optional): Rows fetched per chunk through a server-side cursor, for
+            large results. None (default) fetches the whole result at once, which is faster
+            for the small monthly aggregates.
 
     Returns:
         pd.DataFrame: DataFrame with query results.
     """
     try:
         # Read configuration
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        DB_USER = config['DATABASE']['DB_USER']
-        DB_PASSWORD = config['DATABASE']['DB_PASSWORD']
-        DB_HOST = config['DATABASE']['DB_HOST']
-        DB_PORT = config['DATABASE']['DB_PORT']
-        DB_NAME = config['DATABASE']['DB_NAME']
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
 
         # Configure logger
         configure_logger(BASE_DIR)
 
-        # Create database connection
-        DB_URL = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
-        engine = create_engine(DB_URL)
+        # Reuse the cached engine and its pooled connections
+        engine = get_engine(config_path)
         logger.info(f"Connected to database: {DB_NAME} for {table}")
 
         # Execute query and load into DataFrame
-        with engine.connect() as connection:
-            df = pd.read_sql(text(sql_query), connection)
-            logger.info(f"Retrieved {len(df)} rows from {table} ")
+        if chunksize is None:
+            with engine.connect() as connection:
+                df = pd.read_sql(text(sql_query), connection)
+        else:
+            # Stream the rows from a server-side cursor so only one chunk is held as Python rows
+            with engine.connect().execution_options(stream_results=True) as connection:
+                chunks = pd.read_sql(text(sql_query), connection, chunksize=chunksize)
+                df = pd.concat(chunks, ignore_index=True, copy=False)
+        logger.info(f"Retrieved {len(df)} rows from {table} ")
 
         # Save DataFrame to CSV
         csv_file = BASE_DIR / csv_filename
-        df.to_csv(csv_file, index=False)
-        logger.info(f"Saved DataFrame to {csv_file}")
-        return df
+        _IO_POOL.submit(write_csv, df, csv_file)
+        return add_month_columns(df)
 
     except Exception as e:
         logger.error(f"Error in {table}: {str(e)}")
         raise
 
-    finally:
-        engine.dispose()
-        logger.info("Database connection closed.")
+def stats_month_batched(config_path, queries, chunksize=None):
+    """
+    Runs several stats queries in a single round-trip and saves each result to its own CSV.
+    Every query is wrapped as one branch of a UNION ALL that returns its rows as JSON tagged
+    with the query name, so queries with different columns can share the statement.
+
+    Args:
+        config_path (str): Path to the config.ini file.
+        queries (dict): {name: (sql_query, csv_filename)}, csv_filename relative to BASE_DIR.
+        chunksize (int, optional): Rows fetched per chunk through a server-side cursor, as in
+            stats_month. None (default) fetches the whole result at once.
+
+    Returns:
+        dict: {name: pd.DataFrame} with the results of each query.
+    """
+    try:
+        # Read configuration
+        DB_NAME = load_config(config_path)['DATABASE']['DB_NAME']
+
+        # Configure logger
+        configure_logger(BASE_DIR)
+
+        # Reuse the cached engine and its pooled connections
+        engine = get_engine(config_path)
+        logger.info(f"Connected to database: {DB_NAME} for {', '.join(queries)}")
 
-def plot_clients_joined(df):
+        # row_num keeps the ORDER BY of each query once the branches are merged
+        batched_query = "\nUNION ALL\n".join(
+            f"SELECT '{name}' AS src, row_number() OVER () AS row_num, to_json(q) AS row "
+            f"FROM ({sql_query.strip().rstrip(';')}) q"
+            for name, (sql_query, _) in queries.items()) + "\nORDER BY src, row_num;"
+
+        # Execute query and load into DataFrame
+        if chunksize is None:
+            with engine.connect() as connection:
+                df = pd.read_sql(text(batched_query), connection)
+        else:
+            # Stream the rows from a server-side cursor so only one chunk is held as Python rows
+            with engine.connect().execution_options(stream_results=True) as connection:
+                chunks = pd.read_sql(text(batched_query), connection, chunksize=chunksize)
+                df = pd.concat(chunks, ignore_index=True, copy=False)
+        logger.info(f"Retrieved {len(df)} rows for {len(queries)} queries")
+
+        # Split the rows back into one DataFrame per query and save each to CSV
+        frames = {name: pd.DataFrame(list(group['row'])) for name, group in df.groupby('src', sort=False)}
+        # Queries without rows have no JSON to take the columns from, their column names are
+        # read from a LIMIT 0 run so the CSV keeps its header and the plots find the columns
+        empty = [name for name in queries if name not in frames]
+        if empty:
+            with engine.connect() as connection:
+                for name in empty:
+                    sql_query = queries[name][0].strip().rstrip(';')
+                    columns = connection.execute(text(f"SELECT * FROM ({sql_query}) q LIMIT 0")).keys()
+                    frames[name] = pd.DataFrame(columns=list(columns))
+                    logger.warning(f"Query {name} returned no rows")
+        for name, (_, csv_filename) in queries.items():
+            csv_file = BASE_DIR / csv_filename
+            _IO_POOL.submit(write_csv, frames[name], csv_file)
+            if 'month' in frames[name].columns:
+                frames[name] = add_month_columns(frames[name])
+        return frames
+
+    except Exception as e:
+        logger.error(f"Error in stats_month_batched: {str(e)}")
+        raise
+
+def plot_clients_joined(df, dpi=100, fmt='png', max_points=None):
     """
-    Plots the number of clients joined per month and saves the plot as a JPG.
+    Plots the number of clients joined per month and saves the plot as an image.
 
     Args:
         df (pd.DataFrame): DataFrame with 'month' and 'clients_joined' columns.
+        dpi (int): Resolution of the saved image (default 100).
+        fmt (str): Image format, 'png' (default) or 'jpg'.
+        max_points (int): If set and df has more rows, months are summed per quarter before
+            plotting so fewer markers are drawn (default None, every month is plotted).
     """
     try:
         # Create plots directory
@@ -216,87 +440,260 @@ def plot_clients_joined(df):
         # Generate filename with current day, hour, and minute (CDT, July 15, 2025, 11:38 AM)
         current_time = datetime(2025, 7, 15, 11, 38)  # Fixed to system-provided time
         time_str = current_time.strftime('%Y-%m-%d_%H-%M')
-        plot_file = plot_dir / f'clients_joined_per_month_{time_str}.jpg'
-
-        # Extract years from months
-        df['year'] = df['month'].str[:4]
-        years = df['year'].unique()
-
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(34, 6))
-
-        # Plot the data
-        ax.plot(df['month'], df['clients_joined'], marker='o', linestyle='-', color='b')
-
-        # Alternate background colors by year (January to December)
-        for i, year in enumerate(years):
-            # Filter months for the current year
-            year_months = df[df['year'] == year]['month']
-            if not year_months.empty:
-                # Find the first and last month indices for this year
-                start_month = year + '-01'  # January
-                end_month = year + '-12'  # December
-                start_idx = df.index[df['month'] == start_month].tolist()
-                end_idx = df.index[df['month'] == end_month].tolist()
-                start_idx = start_idx[0] if start_idx else 0
-                end_idx = end_idx[0] if end_idx else len(df) - 1
-
-                # Adjust end_idx to ensure it doesn't exceed data range
-                end_idx = min(end_idx, len(df) - 1) if end_idx != -1 else len(df) - 1
-                if start_idx <= end_idx:
-                    color = 'lightblue' if i % 2 == 0 else 'white'
-                    ax.add_patch(Rectangle((start_idx - 0.5, ax.get_ylim()[0]),
-                                           end_idx - start_idx + 1,
-                                           ax.get_ylim()[1] - ax.get_ylim()[0],
-                                           facecolor=color, alpha=0.3))
-
-        # Set x-axis ticks with increased spacing (every 2 months)
-        num_months = len(df['month'])
-        tick_interval = 1
-        ax.set_xticks(range(0, num_months, tick_interval))
-        month_labels = [pd.to_datetime(m, format='%Y-%m').strftime('%b') for m in df['month']]
-        ax.set_xticklabels(
-            [month_labels[i] if i < len(month_labels) else '' for i in range(0, num_months, tick_interval)],
-            rotation=45, ha='right')
-
-        # Add year labels centered under each year's months
-        year_positions = []
-        for year in years:
-            year_months = df[df['year'] == year]['month']
-            mid_idx = df.index[df['month'] == year_months.iloc[len(year_months) // 2]].tolist()[0]
-            year_positions.append((mid_idx, year))
-        ax2 = ax.twiny()
-        ax2.set_xlim(ax.get_xlim())
-        ax2.set_xticks([pos for pos, _ in year_positions])
-        ax2.set_xticklabels([year for _, year in year_positions])
-        ax2.set_xlabel('Year')
+        plot_file = plot_dir / f'clients_joined_per_month_{time_str}.{fmt}'
+
+        # Same data and settings give the same image, a copy of the cached render is enough
+        cache_file = plot_dir / '.plot_cache' / f"{plot_cache_key(df[['month', 'clients_joined']], dpi, max_points)}.{fmt}"
+        if cache_file.exists():
+            cache_file.touch()  # most recently used, kept by prune_plot_cache
+            shutil.copyfile(cache_file, plot_file)
+            logger.info(f"Plot saved to {plot_file} (cached render)")
+            return
+
+        if max_points and len(df) > max_points:
+            df = quarterly_totals(df, 'clients_joined')
+
+        # Tick labels and year spans, computed once per distinct month sequence
+        month_labels, year_spans = month_ticks(tuple(df['month']))
+
+        # Create figure and axis, reused from the previous call if there was one
+        fig, ax = get_fig((34, 6))
+
+        # Plot the data against the row positions, the ticks are labelled below so the
+        # month strings do not go through the categorical unit converter
+        num_months = len(df)
+        ax.plot(np.arange(num_months), df['clients_joined'].to_numpy(), marker='o', linestyle='-', color='b')
+
+        # Alternate background colors by year (January to December), axvspan covers the
+        # full y range so the limits are not needed
+        for i, (_, start_idx, end_idx) in enumerate(year_spans):
+            color = 'lightblue' if i % 2 == 0 else 'white'
+            ax.axvspan(start_idx - 0.5, end_idx + 0.5, facecolor=color, alpha=0.3)
+
+        # One tick per month
+        ax.set_xticks(range(num_months))
+        ax.set_xticklabels(month_labels, rotation=45, ha='right')
+
+        # Add year labels centered over each year's months, taken from the same year spans.
+        # Plain text artists in x data / y axes coordinates, no extra axis or ticks to draw
+        xaxis_transform = ax.get_xaxis_transform()
+        for year, start_idx, end_idx in year_spans:
+            mid = start_idx + (end_idx - start_idx + 1) // 2
+            ax.text(mid, 1.01, str(year), transform=xaxis_transform, ha='center', va='bottom')
+        ax.annotate('Year', xy=(0.5, 1.06), xycoords='axes fraction', ha='center', va='bottom')
 
         # Double the space between x-axis points
         ax.tick_params(axis='x', pad=30, length=0)
 
         # Set labels and title
-        ax.set_title('Clients Joined Per Month')
+        ax.set_title('Clients Joined Per Month', pad=30)
         ax.set_xlabel('Month')
         ax.set_ylabel('Number of Clients Joined')
         ax.grid(True)
-        plt.tight_layout()
+        fig.tight_layout()
 
-        # Save the plot as JPG
-        plt.savefig(plot_file, format='jpg', dpi=300)
-        plt.close()
+        # Save the plot to the cache, then copy it to the timestamped file
+        cache_file.parent.mkdir(exist_ok=True)
+        save_plot(fig, cache_file, fmt, dpi)
+        shutil.copyfile(cache_file, plot_file)
+        prune_plot_cache(cache_file.parent)
         logger.info(f"Plot saved to {plot_file}")
 
     except Exception as e:
         logger.error(f"Error plotting clients joined: {str(e)}")
         raise
 
-def plot_years(years, df):
+@lru_cache(maxsize=16)
+def month_ticks(months):
     """
-    Plots the number of clients joined per month for specified years and saves the plot as a JPG.
+    Builds the x tick labels and the year spans of a month sequence. Cached, so repeated
+    renders of the same months reuse them.
+
+    Args:
+        months (tuple): Month strings in 'YYYY-MM' format, in plot order.
+
+    Returns:
+        tuple: (labels, spans) where labels holds the month abbreviation of every position
+            and spans holds (year, first position, last position) for each year in order.
+    """
+    labels = tuple(calendar.month_abbr[int(month[5:7])] for month in months)
+    bounds = {}
+    for pos, month in enumerate(months):
+        year = int(month[:4])
+        bounds[year] = (bounds[year][0] if year in bounds else pos, pos)
+    spans = tuple((year, first, last) for year, (first, last) in bounds.items())
+    return labels, spans
+
+def prune_plot_cache(cache_dir, keep=PLOT_CACHE_MAX_FILES):
+    """
+    Deletes all but the most recently used cached renders.
+
+    Args:
+        cache_dir (Path): Directory of the cached renders.
+        keep (int): Number of renders to keep (default PLOT_CACHE_MAX_FILES).
+    """
+    files = sorted(cache_dir.iterdir(), key=lambda f: f.stat().st_mtime, reverse=True)
+    for old_file in files[keep:]:
+        old_file.unlink(missing_ok=True)
+
+def plot_cache_key(df, *settings):
+    """
+    Hashes the values of a DataFrame together with the plot settings and PLOT_CACHE_VERSION,
+    used to name cached renders.
+
+    Args:
+        df (pd.DataFrame): Data that is plotted.
+        *settings: Plot settings that change the image (e.g. dpi).
+
+    Returns:
+        str: Hex sha256 digest.
+    """
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    digest.update(repr((PLOT_CACHE_VERSION, settings)).encode())
+    return digest.hexdigest()
+
+def add_month_columns(df):
+    """
+    Parses the 'month' column once and adds it as integer 'year_int' and 'month_num' columns,
+    so the plots never parse month strings again. Frames that already have them are returned as is.
+
+    Args:
+        df (pd.DataFrame): DataFrame with a 'month' ('YYYY-MM') column.
+
+    Returns:
+        pd.DataFrame: A new DataFrame with 'year_int' and 'month_num' columns.
+    """
+    if 'month_num' not in df.columns:
+        month_dt = pd.to_datetime(df['month'], format='%Y-%m', cache=True)
+        # assign returns a new frame, the one being written to CSV in the background is untouched
+        df = df.assign(year_int=month_dt.dt.year, month_num=month_dt.dt.month)
+    return df
+
+def quarterly_totals(df, value_column):
+    """
+    Sums a per-month DataFrame per quarter, each quarter is labelled with its last month
+    so the result keeps the 'month' ('YYYY-MM') format.
+
+    Args:
+        df (pd.DataFrame): DataFrame with 'month' ('YYYY-MM') and value_column.
+        value_column (str): Column to sum.
+
+    Returns:
+        pd.DataFrame: One row per quarter with 'month' and value_column.
+    """
+    quarters = pd.to_datetime(df['month'], format='%Y-%m').dt.to_period('Q')
+    totals = df[value_column].groupby(quarters).sum()
+    return pd.DataFrame({
+        'month': totals.index.asfreq('M', 'end').strftime('%Y-%m'),
+        value_column: totals.to_numpy(),
+    })
+
+def monthly_pivot(df, value_column):
+    """
+    Pivots a per-month DataFrame into one column per year with a row for each month,
+    in a single vectorized pass.
+
+    Args:
+        df (pd.DataFrame): DataFrame with 'month' ('YYYY-MM') and value_column.
+        value_column (str): Column with the value of each month.
+
+    Returns:
+        pd.DataFrame: Index 1-12 (month number), one column per year (int), months without data are 0.
+    """
+    df = add_month_columns(df)
+    pivot = df.pivot_table(index='month_num', columns='year_int', values=value_column,
+                           aggfunc='first', fill_value=0)
+    return pivot.reindex(range(1, 13), fill_value=0)
+
+def plot_year_lines(ax, month_order, pivot, years, colors):
+    """
+    Draws one line per year with a single ax.plot call on the 2-D (month x year) array,
+    colors and labels are set on the returned lines afterwards. Years missing from the
+    pivot are skipped but keep their color slot.
+
+    Args:
+        ax (Axes): Axis to draw on.
+        month_order (list): Month labels for the x-axis.
+        pivot (pd.DataFrame): Output of monthly_pivot.
+        years (list): Years to plot (e.g., ['2024', '2025']).
+        colors (list): Line colors, cycled by the position of the year in years.
+    """
+    present = [(i, year) for i, year in enumerate(years) if int(year) in pivot.columns]
+    if not present:
+        return
+    lines = ax.plot(month_order, pivot[[int(year) for _, year in present]].to_numpy(),
+                    marker='o', linestyle='-', markersize=4)  # Reduced marker size from default 6 to 4
+    for line, (i, year) in zip(lines, present):
+        line.set_color(colors[i % len(colors)])
+        line.set_label(str(year))
+
+def save_plot(fig, plot_file, fmt, dpi):
+    """
+    Saves a figure, PNG files use zlib level 1 which is much faster to encode than the default
+    and JPG files are written at quality 85 with optimized Huffman tables.
+
+    Args:
+        fig (Figure): Figure to save.
+        plot_file (Path): Output image path.
+        fmt (str): Image format, e.g. 'png' or 'jpg'.
+        dpi (int): Resolution of the saved image.
+    """
+    if fmt == 'png':
+        pil_kwargs = {'compress_level': 1}
+    elif fmt in ('jpg', 'jpeg'):
+        pil_kwargs = {'quality': 85, 'optimize': True, 'progressive': True}
+    else:
+        pil_kwargs = None
+    fig.savefig(plot_file, format=fmt, dpi=dpi, pil_kwargs=pil_kwargs)
+
+@lru_cache(maxsize=None)
+def _pyplot():
+    """
+    Imports pyplot on first use, so the database-only functions do not pay for the
+    matplotlib import.
+
+    Returns:
+        module: matplotlib.pyplot, set up for saving plots to files.
+    """
+    import matplotlib
+    # Plots are only saved to files, the non-interactive Agg backend skips any GUI toolkit
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    # Simplify line paths before rendering, the long monthly series send fewer segments to Agg
+    plt.rcParams.update({'path.simplify': True, 'path.simplify_threshold': 1.0, 'agg.path.chunksize': 10000})
+    return plt
+
+# Figures reused across plot calls, keyed by figsize
+_FIG_CACHE = {}
+
+def get_fig(figsize):
+    """
+    Returns a figure and axis of the given size, created on first use and cleared on later
+    calls, so repeated plots do not allocate a new figure and Agg buffer each time.
+
+    Args:
+        figsize (tuple): Figure size in inches.
+
+    Returns:
+        tuple: (Figure, Axes) ready to draw on.
+    """
+    if figsize in _FIG_CACHE:
+        fig, ax = _FIG_CACHE[figsize]
+        ax.cla()
+    else:
+        fig, ax = _pyplot().subplots(figsize=figsize)
+        _FIG_CACHE[figsize] = (fig, ax)
+    return fig, ax
+
+def plot_years(years, df, dpi=100, fmt='png'):
+    """
+    Plots the number of clients joined per month for specified years and saves the plot as an image.
 
     Args:
         years (list): List of years (e.g., ['2024', '2025']) to plot.
         df (pd.DataFrame): DataFrame with 'month' and 'clients_joined' columns.
+        dpi (int): Resolution of the saved image (default 100).
+        fmt (str): Image format, 'png' (default) or 'jpg'.
     """
     try:
 
@@ -307,28 +704,18 @@ def plot_years(years, df):
         # Generate filename with current day, hour, and minute (CDT, July 15, 2025, 11:46 AM)
         current_time = datetime(2025, 7, 15, 11, 46)  # Fixed to system-provided time
         time_str = current_time.strftime('%Y-%m-%d_%H-%M')
-        plot_file = plot_dir / f'multiple_years_{time_str}.jpg'
+        plot_file = plot_dir / f'multiple_years_{time_str}.{fmt}'
 
         # Define 7 distinct colors
         colors = ['b', 'g', 'r', 'c', 'm', 'y', 'k']
         month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
         # Create figure and axis
-        fig, ax = plt.subplots(figsize=(15, 6))
-
-        # Prepare data for each year
-        for i, year in enumerate(years):
-            year_data = df[df['month'].str.startswith(year)]
-            if not year_data.empty:
-                # Create a complete month series with 12 values (Jan to Dec)
-                monthly_data = {month: 0 for month in month_order}
-                for month in year_data['month']:
-                    month_num = pd.to_datetime(month, format='%Y-%m').month - 1  # 0-based index
-                    monthly_data[month_order[month_num]] = \
-                    year_data[year_data['month'] == month]['clients_joined'].iloc[0]
-                ax.plot(month_order, list(monthly_data.values()),
-                        marker='o', linestyle='-', color=colors[i % len(colors)],
-                        label=year, markersize=4)  # Reduced marker size from default 6 to 4
+        fig, ax = get_fig((15, 6))
+
+        # Complete month series with 12 values (Jan to Dec) for every year
+        pivot = monthly_pivot(df, 'clients_joined')
+        plot_year_lines(ax, month_order, pivot, years, colors)
 
         # Set labels and title
         ax.set_title('Clients Joined Per Month by Year')
@@ -341,27 +728,28 @@ def plot_years(years, df):
         ax.set_xticks(range(12))
         ax.set_xticklabels(month_order)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
-        # Save the plot as JPG
-        plt.savefig(plot_file, format='jpg', dpi=300)
-        plt.close()
+        # Save the plot, the figure stays open for the next call
+        save_plot(fig, plot_file, fmt, dpi)
         logger.info(f"Plot saved to {plot_file}")
 
     except Exception as e:
         logger.error(f"Error plotting years: {str(e)}")
         raise
 
-def plot_years_wp_old(df, title, xlabel, ylabel, filename_prefix):
+def plot_years_wp_old(df, title, xlabel, ylabel, filename_prefix, dpi=100, fmt='png'):
     """
-    Plots data per month for specified years and saves the plot as a JPG.
+    Plots data per month for specified years and saves the plot as an image.
 
     Args:
         df (pd.DataFrame): DataFrame with 'month' and a value column (e.g., 'clients_joined', 'estimates_count').
         title (str): Title of the plot.
         xlabel (str): Label for the x-axis.
         ylabel (str): Label for the y-axis.
-        filename_prefix (str): Prefix for the JPG filename (e.g., 'multiple_clients', 'multiple_estimates').
+        filename_prefix (str): Prefix for the image filename (e.g., 'multiple_clients', 'multiple_estimates').
+        dpi (int): Resolution of the saved image (default 100).
+        fmt (str): Image format, 'png' (default) or 'jpg'.
     """
     try:
 
@@ -372,32 +760,19 @@ def plot_years_wp_old(df, title, xlabel, ylabel, filename_prefix):
         # Generate filename with current day, hour, and minute (CDT, July 15, 2025, 12:25 PM)
         current_time = datetime(2025, 7, 15, 12, 25)  # Fixed to system-provided time
         time_str = current_time.strftime('%Y-%m-%d_%H-%M')
-        plot_file = plot_dir / f'{filename_prefix}_{time_str}.jpg'
+        plot_file = plot_dir / f'{filename_prefix}_{time_str}.{fmt}'
 
         # Define 7 distinct colors
         colors = ['b', 'g', 'r', 'c', 'm', 'y', 'k']
         month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
-        # Extract unique years from the month column
-        df['year'] = df['month'].str[:4]
-        years = df['year'].unique()
-
         # Create figure and axis
-        fig, ax = plt.subplots(figsize=(15, 6))
+        fig, ax = get_fig((15, 6))
 
-        # Prepare data for each year
+        # Complete month series with 12 values (Jan to Dec) for every year in the data
         value_column = df.columns[1]  # Assumes second column is the value (e.g., 'clients_joined')
-        for i, year in enumerate(years):
-            year_data = df[df['month'].str.startswith(year)]
-            if not year_data.empty:
-                # Create a complete month series with 12 values (Jan to Dec)
-                monthly_data = {month: 0 for month in month_order}
-                for month in year_data['month']:
-                    month_num = pd.to_datetime(month, format='%Y-%m').month - 1  # 0-based index
-                    monthly_data[month_order[month_num]] = year_data[year_data['month'] == month][value_column].iloc[0]
-                ax.plot(month_order, list(monthly_data.values()),
-                        marker='o', linestyle='-', color=colors[i % len(colors)],
-                        label=year, markersize=4)  # Reduced marker size from default 6 to 4
+        pivot = monthly_pivot(df, value_column)
+        plot_year_lines(ax, month_order, pivot, pivot.columns, colors)
 
         # Set labels and title
         ax.set_title(title)
@@ -410,20 +785,19 @@ def plot_years_wp_old(df, title, xlabel, ylabel, filename_prefix):
         ax.set_xticks(range(12))
         ax.set_xticklabels(month_order)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
-        # Save the plot as JPG
-        plt.savefig(plot_file, format='jpg', dpi=300)
-        plt.close()
+        # Save the plot, the figure stays open for the next call
+        save_plot(fig, plot_file, fmt, dpi)
         logger.info(f"Plot saved to {plot_file}")
 
     except Exception as e:
         logger.error(f"Error plotting years: {str(e)}")
         raise
 
-def plot_years_wp(df, years, title, xlabel, ylabel, filename_prefix):
+def plot_years_wp(df, years, title, xlabel, ylabel, filename_prefix, dpi=100, fmt='png'):
     """
-    Plots data per month for specified years and saves the plot as a JPG.
+    Plots data per month for specified years and saves the plot as an image.
 
     Args:
         df (pd.DataFrame): DataFrame with 'month' and a value column (e.g., 'clients_joined', 'total_invoices').
@@ -431,7 +805,9 @@ def plot_years_wp(df, years, title, xlabel, ylabel, filename_prefix):
         title (str): Title of the plot.
         xlabel (str): Label for the x-axis.
         ylabel (str): Label for the y-axis.
-        filename_prefix (str): Prefix for the JPG filename (e.g., 'multiple_clients', 'multiple_estimates').
+        filename_prefix (str): Prefix for the image filename (e.g., 'multiple_clients', 'multiple_estimates').
+        dpi (int): Resolution of the saved image (default 100).
+        fmt (str): Image format, 'png' (default) or 'jpg'.
     """
     try:
 
@@ -442,34 +818,23 @@ def plot_years_wp(df, years, title, xlabel, ylabel, filename_prefix):
         # Generate filename with current day, hour, and minute (CDT, July 15, 2025, 12:44 PM)
         current_time = datetime(2025, 7, 15, 12, 44)  # Fixed to system-provided time
         time_str = current_time.strftime('%Y-%m-%d_%H-%M')
-        plot_file = plot_dir / f'{filename_prefix}_{time_str}.jpg'
+        plot_file = plot_dir / f'{filename_prefix}_{time_str}.{fmt}'
 
         # Define 7 distinct colors
         colors = ['b', 'g', 'r', 'c', 'm', 'y', 'k']
         month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
         # Create figure and axis
-        fig, ax = plt.subplots(figsize=(15, 6))
+        fig, ax = get_fig((15, 6))
 
-        # Prepare data for each specified year
+        # Complete month series with 12 values (Jan to Dec) for every year
         value_column = df.columns[1]  # Assumes second column is the value (e.g., 'clients_joined', 'total_invoices')
-        current_year = datetime.now().year  # 2025
-        for i, year in enumerate(years):
-            year_data = df[df['month'].str.startswith(str(year))]
-            if not year_data.empty:
-                # Create a complete month series with 12 values (Jan to Dec)
-                monthly_data = {month: 0 for month in month_order}
-                for month in year_data['month']:
-                    month_num = pd.to_datetime(month, format='%Y-%m').month - 1  # 0-based index
-                    monthly_data[month_order[month_num]] = year_data[year_data['month'] == month][value_column].iloc[0]
-                # For the current year (2025), do not paint zeros for July to December
-                if int(year) == current_year:
-                    last_month = 5  # June is month 6, 0-based index is 5
-                    for m in range(last_month + 1, 12):
-                        monthly_data[month_order[m]] = None
-                ax.plot(month_order, [v if v is not None else float('nan') for v in list(monthly_data.values())],
-                        marker='o', linestyle='-', color=colors[i % len(colors)],
-                        label=year, markersize=4)  # Reduced marker size from default 6 to 4
+        pivot = monthly_pivot(df, value_column).astype(float)
+        # For the current year, do not paint zeros from the current (incomplete) month to December
+        now = datetime.now()
+        if now.year in pivot.columns:
+            pivot.loc[now.month:, now.year] = np.nan
+        plot_year_lines(ax, month_order, pivot, years, colors)
 
         # Set labels and title
         ax.set_title(title)
@@ -482,19 +847,35 @@ def plot_years_wp(df, years, title, xlabel, ylabel, filename_prefix):
         ax.set_xticks(range(12))
         ax.set_xticklabels(month_order)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
-        # Save the plot as JPG
-        plt.savefig(plot_file, format='jpg', dpi=300)
-        plt.close()
+        # Save the plot, the figure stays open for the next call
+        save_plot(fig, plot_file, fmt, dpi)
         logger.info(f"Plot saved to {plot_file}")
 
     except Exception as e:
         logger.error(f"Error plotting years: {str(e)}")
         raise
 
+def _render(task):
+    """
+    Worker entry point of the plot process pool, renders one plot_years_wp task.
+
+    Args:
+        task (tuple): (df, years, title, xlabel, ylabel, filename_prefix, dpi) arguments of plot_years_wp.
+    """
+    configure_logger(BASE_DIR)
+    plot_years_wp(*task)
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Monthly stats and plots')
+    parser.add_argument('--print-quality', action='store_true', help='Save the plots at 300 dpi for archival exports')
+    parser.add_argument('--gzip-csv', action='store_true', help='Write the stats CSV files gzip compressed (.csv.gz)')
+    args = parser.parse_args()
+    dpi = 300 if args.print_quality else 100
+    csv_ext = '.csv.gz' if args.gzip_csv else '.csv'
+
     # Default config path and ingestion date
     config_path = 'config.ini'
     ingestion_date = "2025-07-11" # datetime.now().strftime('%Y-%m-%d')
@@ -503,7 +884,7 @@ if __name__ == "__main__":
     #update_client_join_date(config_path, ingestion_date)
 
     # df = clients_join_month(config_path)
-    # df = pd.read_csv(BASE_DIR / 'data' / 'clients' / 'clients_per_month.csv')
+    # df = pd.read_csv(BASE_DIR / 'data' / 'clients' / 'clients_per_month.csv', dtype={'month': str, 'clients_joined': 'int32'})
     # plot_clients_joined(df)
     years= ['2019', '2020', '2021', '2024', '2025']
     # plot_years(years, df)
@@ -520,10 +901,6 @@ if __name__ == "__main__":
     GROUP BY TO_CHAR(join_date, 'YYYY-MM')
     ORDER BY month;
     """
-    df_clients = stats_month(config_path, clients_query, 'clients', 'clients_per_month.csv')
-    # print("Number of new clients per month:")
-    # print(df_clients)
-    plot_years_wp(df_clients, years, 'Clients Joined Per Month by Year', 'Month', 'Number of Clients Joined', 'multiple_clients')
 
  # Example 2: Number of estimates per month
     estimates_query = """
@@ -534,10 +911,6 @@ if __name__ == "__main__":
     GROUP BY TO_CHAR(date_issued, 'YYYY-MM')
     ORDER BY month;
     """
-    df_estimates = stats_month(config_path, estimates_query, 'estimates', 'estimates_per_month.csv')
-    # print("Number of estimates per month:")
-    # print(df_estimates)
-    plot_years_wp(df_estimates, years, 'Estimates Per Month by Year', 'Month', 'Number of Estimates', 'multiple_estimates')
 
     # Example 3: Number of invoices per month
     invoices_query = """
@@ -548,10 +921,6 @@ if __name__ == "__main__":
     GROUP BY TO_CHAR(date_issued, 'YYYY-MM')
     ORDER BY month;
     """
-    df_invoices = stats_month(config_path, invoices_query, 'invoices', 'invoices_per_month.csv')
-    # print("Number of invoices per month:")
-    # print(df_invoices)
-    plot_years_wp(df_invoices, years, 'Invoices Per Month by Year', 'Month', 'Number of Invoices', 'multiple_invoices')
 
     # Example 4: Sum of invoices per month
     sum_invoices_query = """
@@ -562,48 +931,80 @@ if __name__ == "__main__":
     GROUP BY TO_CHAR(i.date_issued, 'YYYY-MM')
     ORDER BY month;
     """
-    df_sum_invoices = stats_month(config_path, sum_invoices_query, 'invoices', 'sum_invoices_per_month.csv')
-    # print("Sum of invoices per month:")
-    # print(df_sum_invoices)
-    plot_years_wp(df_sum_invoices, years,'Total Invoice Value Per Month by Year', 'Month', 'Total Invoice Value', 'multiple_invoice_values')
 
-    # Example 5: Top 5 customers with most invoice value total per month
+    # Example 5: Total invoice value of the top 5 customers of each month
     top5_high_query = """
-    SELECT 
-        TO_CHAR(i.date_issued, 'YYYY-MM') AS month,
-        c.full_name,
-        SUM(i.total) AS total_value
-    FROM invoices i
-    JOIN clients c ON i.full_name = c.full_name
-    GROUP BY TO_CHAR(i.date_issued, 'YYYY-MM'), c.full_name
-    ORDER BY month, total_value DESC
-    LIMIT 5;
-    """
-    df_top5_high = stats_month(config_path, top5_high_query, 'invoices',
-                                      'top5_high_invoices_per_month.csv')
-    # print("Top 5 customers with most invoice value per month:")
-    # print(df_top5_high)
-    df_top5_high_agg = df_top5_high.groupby('month')['total_value'].sum().reset_index()
-    plot_years_wp(df_top5_high_agg, years, 'Total Invoice Value for Top 5 Clients Per Month by Year', 'Month',
-                  'Total Invoice Value', 'multiple_top5_clients')
-
-    # Example 6: Top 5 clients with least invoice value total per month
+    WITH per_client AS (
+        SELECT 
+            TO_CHAR(i.date_issued, 'YYYY-MM') AS month,
+            c.full_name,
+            SUM(i.total) AS total_value
+        FROM invoices i
+        JOIN clients c ON i.full_name = c.full_name
+        GROUP BY TO_CHAR(i.date_issued, 'YYYY-MM'), c.full_name
+    ), ranked AS (
+        SELECT month, total_value,
+               ROW_NUMBER() OVER (PARTITION BY month ORDER BY total_value DESC) AS rn
+        FROM per_client
+    )
+    SELECT month, SUM(total_value) AS total_value
+    FROM ranked
+    WHERE rn <= 5
+    GROUP BY month
+    ORDER BY month;
+    """
+
+    # Example 6: Total invoice value of the 5 clients with the least (non-zero) value of each month
     top5_low_query = """
-    SELECT 
-        TO_CHAR(i.date_issued, 'YYYY-MM') AS month,
-        c.full_name,
-        SUM(i.total) AS total_value
-    FROM invoices i
-    JOIN clients c ON i.full_name = c.full_name
-    GROUP BY TO_CHAR(i.date_issued, 'YYYY-MM'), c.full_name
-    HAVING SUM(i.total) > 0
-    ORDER BY month, total_value ASC
-    LIMIT 5;
-    """
-    df_top5_low = stats_month(config_path, top5_low_query, 'invoices_clients',
-                                     'top5_low_invoices_per_month.csv')
-    # print("Top 5 clients with least invoice value per month:")
-    # print(df_top5_low)
-    df_top5_low_agg = df_top5_low.groupby('month')['total_value'].sum().reset_index()
-    plot_years_wp(df_top5_low_agg, years, 'Total Invoice Value for Bottom 5 Clients Per Month by Year', 'Month',
-                  'Total Invoice Value', 'multiple_bottom5_clients')
+    WITH per_client AS (
+        SELECT 
+            TO_CHAR(i.date_issued, 'YYYY-MM') AS month,
+            c.full_name,
+            SUM(i.total) AS total_value
+        FROM invoices i
+        JOIN clients c ON i.full_name = c.full_name
+        GROUP BY TO_CHAR(i.date_issued, 'YYYY-MM'), c.full_name
+        HAVING SUM(i.total) > 0
+    ), ranked AS (
+        SELECT month, total_value,
+               ROW_NUMBER() OVER (PARTITION BY month ORDER BY total_value ASC) AS rn
+        FROM per_client
+    )
+    SELECT month, SUM(total_value) AS total_value
+    FROM ranked
+    WHERE rn <= 5
+    GROUP BY month
+    ORDER BY month;
+    """
+
+    # Run the six stats queries in a single round-trip
+    frames = stats_month_batched(config_path, {
+        'clients': (clients_query, 'clients_per_month' + csv_ext),
+        'estimates': (estimates_query, 'estimates_per_month' + csv_ext),
+        'invoices': (invoices_query, 'invoices_per_month' + csv_ext),
+        'sum_invoices': (sum_invoices_query, 'sum_invoices_per_month' + csv_ext),
+        'top5_high': (top5_high_query, 'top5_high_invoices_per_month' + csv_ext),
+        'top5_low': (top5_low_query, 'top5_low_invoices_per_month' + csv_ext),
+    })
+
+    # The six plots are independent, render them in parallel processes.
+    # spawn starts clean workers instead of forking while the CSV writer threads are running
+    plot_tasks = [
+        (frames['clients'], years, 'Clients Joined Per Month by Year', 'Month', 'Number of Clients Joined', 'multiple_clients', dpi),
+        (frames['estimates'], years, 'Estimates Per Month by Year', 'Month', 'Number of Estimates', 'multiple_estimates', dpi),
+        (frames['invoices'], years, 'Invoices Per Month by Year', 'Month', 'Number of Invoices', 'multiple_invoices', dpi),
+        (frames['sum_invoices'], years, 'Total Invoice Value Per Month by Year', 'Month', 'Total Invoice Value', 'multiple_invoice_values', dpi),
+        (frames['top5_high'], years, 'Total Invoice Value for Top 5 Clients Per Month by Year', 'Month',
+         'Total Invoice Value', 'multiple_top5_clients', dpi),
+        (frames['top5_low'], years, 'Total Invoice Value for Bottom 5 Clients Per Month by Year', 'Month',
+         'Total Invoice Value', 'multiple_bottom5_clients', dpi),
+    ]
+    # Queries without rows have nothing to plot
+    plot_tasks = [task for task in plot_tasks if not task[0].empty]
+    if plot_tasks:
+        with ProcessPoolExecutor(max_workers=min(len(plot_tasks), os.cpu_count() or 1),
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            list(executor.map(_render, plot_tasks))
+
+    if _FIG_CACHE:
+        _pyplot().close('all')
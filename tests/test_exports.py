@@ -0,0 +1,92 @@
+import configparser
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import exports  # noqa: E402
+
+try:
+    import pglast
+except ImportError:  # the SQL is only parsed when pglast (the PostgreSQL parser) is installed
+    pglast = None
+
+# Rows as COPY ... WITH CSV returns them, already ordered by full_name
+COPY_ROWS = (
+    'Ana,ana@example.com,t,t,f\n'
+    'Bob,bob@example.com,t,f,t\n'
+    'Bobby,bob@example.com,f,t,f\n'
+)
+
+
+class FakeCursor:
+    def __init__(self, statements):
+        self.statements = statements
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, sql, buf):
+        self.statements.append(sql)
+        buf.write(COPY_ROWS)
+
+
+class FakeConnection:
+    def __init__(self, statements):
+        self.statements = statements
+
+    def cursor(self):
+        return FakeCursor(self.statements)
+
+    def close(self):
+        pass
+
+
+class FakeEngine:
+    def __init__(self):
+        self.statements = []
+
+    def raw_connection(self):
+        return FakeConnection(self.statements)
+
+
+class ExportEmailListsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        base_dir = Path(self.tmp.name)
+        (base_dir / 'data').mkdir()
+        config = configparser.ConfigParser()
+        config['DATABASE'] = {'DB_NAME': 'crm_test'}
+        self.config_path = str(base_dir / 'config.ini')
+        with open(self.config_path, 'w') as f:
+            config.write(f)
+        self.base_dir = exports.BASE_DIR
+        exports.BASE_DIR = base_dir
+        self.engine = FakeEngine()
+        self.counts = exports.export_email_lists(self.config_path, self.engine)
+
+    def tearDown(self):
+        exports.BASE_DIR = self.base_dir
+        self.tmp.cleanup()
+
+    @unittest.skipUnless(pglast, 'pglast is not installed')
+    def test_copy_statement_parses(self):
+        self.assertEqual(len(self.engine.statements), 1)
+        pglast.parse_sql(self.engine.statements[0])
+
+    def test_rows_are_split_per_list(self):
+        self.assertEqual(self.counts, {'customers': 2, 'leads': 1, 'all_clients': 2})
+        customers = (exports.BASE_DIR / 'data/clients/customers.csv').read_text()
+        self.assertEqual(customers, 'full_name,email_address\n'
+                                    'Ana,ana@example.com\n'
+                                    'Bobby,bob@example.com\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
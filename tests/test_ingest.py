@@ -0,0 +1,68 @@
+import gzip
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pyarrow as pa
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import ingest  # noqa: E402
+from ingest import read_csv_chunks  # noqa: E402
+
+CSV_TEXT = 'Estimate #,Client Name,Total\n0012,Jane Doe,100.50\n0013,,7\n'
+
+
+class ReadCsvChunksTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def check(self, file):
+        table = pa.concat_tables(read_csv_chunks(file))
+        self.assertEqual(table.column_names, ['Estimate #', 'Client Name', 'Total'])
+        # Every column is read as string, leading zeros are kept and empty values are null
+        self.assertTrue(all(pa.types.is_string(field.type) for field in table.schema))
+        self.assertEqual(table.column('Estimate #').to_pylist(), ['0012', '0013'])
+        self.assertEqual(table.column('Client Name').to_pylist(), ['Jane Doe', None])
+
+    def test_plain_csv(self):
+        file = self.dir / 'estimates.csv'
+        file.write_text(CSV_TEXT, encoding='utf-8')
+        self.check(file)
+
+    def test_gzip_csv(self):
+        file = self.dir / 'estimates.csv.gz'
+        with gzip.open(file, 'wt', encoding='utf-8') as f:
+            f.write(CSV_TEXT)
+        self.check(file)
+
+    def test_utf8_bom_header(self):
+        file = self.dir / 'estimates_bom.csv'
+        file.write_text(CSV_TEXT, encoding='utf-8-sig')
+        self.check(file)
+
+    def test_multiline_values_across_blocks(self):
+        # Quoted notes with line breaks, in a file read in many small blocks
+        rows = [f'{i:04d},"Client {i}","line one\nline two\r\nline three"' for i in range(200)]
+        file = self.dir / 'estimates_multiline.csv'
+        file.write_text('Estimate #,Client Name,Notes\n' + '\n'.join(rows) + '\n', encoding='utf-8')
+        block_size = ingest.CHUNK_BYTES
+        ingest.CHUNK_BYTES = 1024
+        try:
+            tables = list(read_csv_chunks(file))
+        finally:
+            ingest.CHUNK_BYTES = block_size
+        self.assertGreater(len(tables), 1)
+        table = pa.concat_tables(tables)
+        self.assertEqual(table.num_rows, 200)
+        self.assertEqual(table.column('Client Name').to_pylist()[-1], 'Client 199')
+        self.assertEqual(set(table.column('Notes').to_pylist()), {'line one\nline two\r\nline three'})
+
+
+if __name__ == '__main__':
+    unittest.main()